@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from datetime import datetime
+from iso8601utils import parsers
+from corpus import corpus
+
+
+kinds = ('time', 'date', 'datetime', 'duration', 'interval')
+
+
+def parse_all(parse, strings):
+    for string in strings:
+        try:
+            parse(string)
+        except ValueError:
+            pass
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_valid(benchmark, kind):
+    benchmark.group = 'parsers: valid'
+    benchmark(parse_all, getattr(parsers, kind), corpus(kind))
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_invalid(benchmark, kind):
+    benchmark.group = 'parsers: invalid'
+    benchmark(parse_all, getattr(parsers, kind), corpus(kind, valid=False))
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_try(benchmark, kind):
+    benchmark.group = 'parsers: try, invalid'
+    benchmark(parse_all, getattr(parsers, 'try_' + kind), corpus(kind, valid=False))
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_batch(benchmark, kind):
+    benchmark.group = 'parsers: batch, valid'
+    benchmark(getattr(parsers, kind + 's'), corpus(kind))
+
+
+@pytest.mark.parametrize('valid', (True, False), ids=('valid', 'invalid'))
+def test_parse(benchmark, valid):
+    benchmark.group = 'parsers: parse, mixed kinds'
+    strings = [string for kind in kinds for string in corpus(kind, valid, 200)]
+    benchmark(parse_all, parsers.try_parse, strings)
+
+
+@pytest.mark.parametrize('kind', ('datetime', 'duration'))
+def test_bytes(benchmark, kind):
+    benchmark.group = 'parsers: bytes, valid'
+    benchmark(parse_all, getattr(parsers, kind), [string.encode('ascii') for string in corpus(kind)])
+
+
+def test_baseline_iso8601utils(benchmark):
+    benchmark.group = 'baseline: datetime.fromisoformat grammar'
+    benchmark(parse_all, parsers.datetime, corpus('fromisoformat'))
+
+
+@pytest.mark.skipif(not hasattr(datetime, 'fromisoformat'), reason='Python 3.7+')
+def test_baseline_fromisoformat(benchmark):
+    benchmark.group = 'baseline: datetime.fromisoformat grammar'
+    benchmark(parse_all, datetime.fromisoformat, corpus('fromisoformat'))
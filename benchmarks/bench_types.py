@@ -0,0 +1,94 @@
+import operator
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from datetime import datetime
+from iso8601utils import aggregate, parsers, duration, interval, formatter
+from corpus import corpus
+
+
+@pytest.fixture(scope='module')
+def durations():
+    return parsers.durations(corpus('duration'))
+
+
+@pytest.fixture(scope='module')
+def datetimes():
+    return parsers.datetimes(corpus('fromisoformat'))
+
+
+@pytest.fixture(scope='module')
+def intervals():
+    return parsers.intervals(corpus('interval'), now=datetime(2016, 1, 1))
+
+
+def pairwise(function, values):
+    for (a, b) in zip(values, values[1:]):
+        function(a, b)
+
+
+@pytest.mark.parametrize('operator', (operator.add, operator.sub, operator.lt, operator.eq),
+    ids=('add', 'sub', 'lt', 'eq'))
+def test_duration_binary(benchmark, durations, operator):
+    benchmark.group = 'duration: operators'
+    benchmark(pairwise, operator, durations)
+
+
+@pytest.mark.parametrize('operator', (lambda d: d * 3, lambda d: d // 3, operator.neg, abs, hash),
+    ids=('mul', 'floordiv', 'neg', 'abs', 'hash'))
+def test_duration_unary(benchmark, durations, operator):
+    benchmark.group = 'duration: operators'
+    benchmark(lambda: [operator(d) for d in durations])
+
+
+def test_duration_datetime(benchmark, durations, datetimes):
+    benchmark.group = 'duration: operators'
+    benchmark(lambda: [t + d for (t, d) in zip(datetimes, durations)])
+
+
+def test_duration_sort(benchmark, durations):
+    benchmark.group = 'duration: operators'
+    benchmark(sorted, durations)
+
+
+@pytest.mark.parametrize('reduce', (lambda ds: sum(ds, duration()), aggregate.sum, aggregate.mean),
+    ids=('builtin_sum', 'sum', 'mean'))
+def test_duration_reduce(benchmark, durations, reduce):
+    benchmark.group = 'duration: reductions'
+    benchmark(reduce, durations)
+
+
+def test_duration_reduce_strings(benchmark):
+    benchmark.group = 'duration: reductions'
+    benchmark(aggregate.sum, corpus('duration'))
+
+
+@pytest.mark.parametrize('form', ('start_end', 'start_duration', 'end_duration'))
+def test_interval(benchmark, datetimes, durations, form):
+    benchmark.group = 'interval: construction'
+    pairs = list(zip(datetimes, durations))
+    if form == 'start_end':
+        # duration.from_datetimes moves end into the month of start,
+        # so keep to ends that exist there.
+        ends = [t.replace(year=t.year + 1) for (t, _) in pairs]
+        benchmark(lambda: [interval(start=t, end=e) for ((t, _), e) in zip(pairs, ends)])
+    elif form == 'start_duration':
+        benchmark(lambda: [interval(start=t, duration=d) for (t, d) in pairs])
+    else:
+        benchmark(lambda: [interval(end=t, duration=d) for (t, d) in pairs])
+
+
+def test_duration_string(benchmark, durations):
+    benchmark.group = 'formatting'
+    benchmark(lambda: [d.string() for d in durations])
+
+
+def test_interval_string(benchmark, intervals):
+    benchmark.group = 'formatting'
+    benchmark(lambda: [i.string() for i in intervals])
+
+
+def test_format_many(benchmark, datetimes):
+    benchmark.group = 'formatting'
+    benchmark(formatter.format_many, datetimes)
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from iso8601utils import validators
+from corpus import corpus
+
+
+kinds = ('time', 'date', 'datetime', 'duration', 'interval')
+
+
+def validate_all(validate, strings):
+    for string in strings:
+        validate(string)
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_valid(benchmark, kind):
+    benchmark.group = 'validators: valid'
+    benchmark(validate_all, getattr(validators, kind), corpus(kind))
+
+
+@pytest.mark.parametrize('kind', kinds)
+def test_invalid(benchmark, kind):
+    benchmark.group = 'validators: invalid'
+    benchmark(validate_all, getattr(validators, kind), corpus(kind, valid=False))
@@ -0,0 +1,150 @@
+"""Seeded generators of ISO 8601 strings for the benchmarks. The same
+seed and size always give the same corpus, so runs are comparable.
+
+    $ python benchmarks/corpus.py datetime invalid
+"""
+import random as random_
+from datetime import timedelta
+from iso8601utils import parsers
+
+
+SEED = 8601
+SIZE = 1000
+
+
+def time(random):
+    (hour, minute, second) = (random.randint(0, 23), random.randint(0, 59), random.randint(0, 59))
+    extended = random.random() < 0.5
+    separator = ':' if extended else ''
+    value = '%02d' % hour
+    precision = random.choice(('hour', 'minute', 'second', 'fraction', 'fraction'))
+    if precision != 'hour':
+        value += separator + '%02d' % minute
+    if precision in ('second', 'fraction'):
+        value += separator + '%02d' % second
+    if precision == 'fraction':
+        value += random.choice('.,') + '%03d' % random.randint(0, 999)
+    return value + offset(random, separator)
+
+
+def offset(random, separator=':'):
+    choice = random.random()
+    if choice < 0.4:
+        return 'Z'
+    if choice < 0.5:
+        return ''
+    hours = random.randint(1, 14)
+    return '%s%02d%s%02d' % (random.choice('+-'), hours, separator, random.choice((0, 0, 30, 45)))
+
+
+def date(random):
+    (year, extended) = (random.randint(1000, 2999), random.random() < 0.7)
+    separator = '-' if extended else ''
+    form = random.random()
+    if form < 0.7:
+        return '%04d%s%02d%s%02d' % (year, separator, random.randint(1, 12), separator,
+            random.randint(1, 28))
+    if form < 0.85:
+        return '%04d%sW%02d%s%d' % (year, separator, random.randint(1, 52), separator,
+            random.randint(1, 7))
+    return '%04d%s%03d' % (year, separator, random.randint(1, 365))
+
+
+def datetime(random):
+    if random.random() < 0.5:
+        # RFC 3339, the most common datetime in the wild.
+        return '%04d-%02d-%02dT%02d:%02d:%02d.%03d%s' % (random.randint(1970, 2099),
+            random.randint(1, 12), random.randint(1, 28), random.randint(0, 23),
+            random.randint(0, 59), random.randint(0, 59), random.randint(0, 999), offset(random))
+    return date(random) + 'T' + time(random)
+
+
+def duration(random):
+    form = random.random()
+    if form < 0.1:
+        return 'P%dW' % random.randint(1, 52)
+    if form < 0.2:
+        return 'P%04d-%02d-%02dT%02d:%02d:%02d' % (random.randint(0, 10), random.randint(1, 12),
+            random.randint(1, 28), random.randint(0, 23), random.randint(0, 59), random.randint(0, 59))
+    (value, time) = ('P', False)
+    for (designator, time_) in (('Y', False), ('M', False), ('D', False), ('H', True),
+            ('M', True), ('S', True)):
+        if random.random() < 0.4:
+            if time_ and not time:
+                (value, time) = (value + 'T', True)
+            value += '%d%s' % (random.randint(1, 99), designator)
+    return value if len(value) > 1 else 'P1D'
+
+
+def interval(random):
+    form = random.random()
+    repeats = random.choice(('', '', 'R/', 'R5/'))
+    start = datetime(random)
+    parsed = parsers.try_datetime(start)
+    if form < 0.4 or parsed is None:
+        # Starts the parsers reject are filtered out by corpus.
+        return repeats + start + '/' + duration(random)
+    if form < 0.6:
+        return repeats + duration(random) + '/' + start
+    end = parsed + timedelta(seconds=random.randint(1, 10**7))
+    return repeats + start + '/' + end.strftime('%Y-%m-%dT%H:%M:%S') + offset(random)
+
+
+def fromisoformat(random):
+    """A datetime in the grammar shared by parsers.datetime and
+    datetime.fromisoformat: extended, with milliseconds and a non-zero offset.
+    """
+    return '%04d-%02d-%02dT%02d:%02d:%02d.%03d%s%02d:%02d' % (random.randint(1970, 2099),
+        random.randint(1, 12), random.randint(1, 28), random.randint(0, 23),
+        random.randint(0, 59), random.randint(0, 59), random.randint(0, 999),
+        random.choice('+-'), random.randint(1, 14), random.choice((0, 30, 45)))
+
+
+generators = {'time': time, 'date': date, 'datetime': datetime, 'duration': duration,
+    'interval': interval, 'fromisoformat': fromisoformat}
+
+
+parsers_ = {'time': parsers.try_time, 'date': parsers.try_date,
+    'datetime': parsers.try_datetime, 'fromisoformat': parsers.try_datetime,
+    'duration': parsers.try_duration, 'interval': parsers.try_interval}
+
+
+def corrupt(random, string):
+    """Replace, insert or drop one character of string."""
+    index = random.randrange(len(string))
+    change = random.random()
+    character = random.choice('0123456789:-.TWZPYMDHS/+x')
+    if change < 0.5:
+        return string[:index] + character + string[index + 1:]
+    if change < 0.8:
+        return string[:index] + character + string[index:]
+    return string[:index] + string[index + 1:]
+
+
+cache = {}
+
+
+def corpus(kind, valid=True, size=SIZE, seed=SEED):
+    """Return size strings of kind, all of which parse if valid and none
+    of which do if not. Invalid strings are valid ones with one character
+    replaced, inserted or dropped, so they are near misses rather than noise.
+    """
+    key = (kind, valid, size, seed)
+    if key not in cache:
+        (random, generate, parse) = (random_.Random(seed), generators[kind], parsers_[kind])
+        strings = []
+        while len(strings) < size:
+            string = generate(random)
+            if not valid:
+                string = corrupt(random, string)
+            if (parse(string) is not None) == valid:
+                strings.append(string)
+        cache[key] = strings
+    return cache[key]
+
+
+if __name__ == '__main__':
+    import sys
+    (kind, validity) = (sys.argv[1:] + ['datetime', 'valid'][len(sys.argv) - 1:])[:2]
+    for string in corpus(kind, validity == 'valid', 20):
+        print(string)
@@ -2,4 +2,18 @@ from iso8601utils.interval import interval
 from iso8601utils.duration import duration
 
 __all__ = ['interval', 'duration', 'parsers', 'validators']
-__version__='0.1.2'
\ No newline at end of file
+__version__='0.1.2'
+
+
+# Submodules other than interval and duration, whose names the classes
+# take over, load on first attribute access (Python 3.7+), so that
+# import iso8601utils stays cheap and iso8601utils.parsers still works.
+submodules = ('aggregate', 'aio', 'cache', 'formatter', 'index', 'instrument', 'np', 'parallel', 'parsers',
+    'sets', 'stream', 'tz', 'validators')
+
+
+def __getattr__(name):
+    if name in submodules:
+        from importlib import import_module
+        return import_module('iso8601utils.' + name)
+    raise AttributeError('module \'iso8601utils\' has no attribute \'%s\'' % name)
@@ -0,0 +1,93 @@
+"""Reduce many durations to one: sum, mean and sums by group. Months,
+days and microseconds are accumulated as plain integers and a single
+duration is built at the end, instead of one per addition as with the
+builtin sum(). Strings are parsed as they are read, so a column of
+ISO 8601 durations is parsed and reduced in one pass.
+
+    >>> from iso8601utils import aggregate
+    >>> aggregate.sum(['PT1H', 'PT30M', 'P1D'])
+    iso8601utils.duration(P1DT1H30M)
+    >>> aggregate.sum_by([('a', 'PT1H'), ('b', 'PT2H'), ('a', 'PT1H')])['a']
+    iso8601utils.duration(PT2H)
+"""
+from iso8601utils.duration import duration as duration_, DAY_MICROSECONDS
+from iso8601utils.parsers import check_errors, try_duration
+
+
+def sum(durations, errors='raise'):
+    """Add up durations.
+    :param durations: An iterable of iso8601utils.duration or strings
+    representing ISO 8601 durations.
+    :param errors: 'raise' or 'skip' invalid strings.
+    :return: iso8601utils.duration, zero if there are no durations.
+    :raises: ValueError if errors is 'raise' and a string is invalid.
+    """
+    (count, months, days, microseconds) = totals(durations, errors)
+    return duration_._from_ints(months, days, microseconds)
+
+
+def mean(durations, errors='raise'):
+    """Average durations, averaging months and the rest separately. Both
+    means are rounded down, to a whole month and a whole microsecond.
+    Parameters as for sum.
+    :return: iso8601utils.duration
+    :raises: ValueError if there are no durations, or if errors is
+    'raise' and a string is invalid.
+    """
+    (count, months, days, microseconds) = totals(durations, errors)
+    if not count:
+        raise ValueError('Mean of no durations.')
+    return duration_._from_ints(months // count, 0,
+        (days * DAY_MICROSECONDS + microseconds) // count)
+
+
+def sum_by(pairs, errors='raise'):
+    """Add up durations by key.
+    :param pairs: An iterable of (key, duration) pairs, where each
+    duration is an iso8601utils.duration or a string representing an
+    ISO 8601 duration.
+    :param errors: 'raise' or 'skip' invalid strings.
+    :return: dict of key to iso8601utils.duration
+    :raises: ValueError if errors is 'raise' and a string is invalid.
+    """
+    check_errors(errors, ('raise', 'skip'))
+    groups = {}
+    for (index, (key, value)) in enumerate(pairs):
+        if not isinstance(value, duration_):
+            value = parse(value, index, errors)
+            if value is None:
+                continue
+        try:
+            fields = groups[key]
+        except KeyError:
+            fields = groups[key] = [0, 0, 0]
+        fields[0] += value._months
+        fields[1] += value._days
+        fields[2] += value._microseconds
+    return {key: duration_._from_ints(*fields) for (key, fields) in groups.items()}
+
+
+def totals(durations, errors):
+    """Return the count and the total months, days and microseconds of
+    durations, leaving out invalid strings if errors is 'skip'.
+    """
+    check_errors(errors, ('raise', 'skip'))
+    (count, months, days, microseconds) = (0, 0, 0, 0)
+    for (index, value) in enumerate(durations):
+        if not isinstance(value, duration_):
+            value = parse(value, index, errors)
+            if value is None:
+                continue
+        count += 1
+        months += value._months
+        days += value._days
+        microseconds += value._microseconds
+    return (count, months, days, microseconds)
+
+
+def parse(value, index, errors):
+    result = try_duration(value)
+    if result is None and errors == 'raise':
+        raise ValueError('Invalid ISO 8601 duration at index %d.' % index)
+    return result
+
@@ -0,0 +1,121 @@
+"""Parse ISO 8601 values from line oriented asyncio sources, one value per
+line, without blocking the event loop on large bursts. Sources are async
+iterators of byte chunks; lines may be split across chunks.
+
+    >>> from iso8601utils import aio
+    >>> async for values in aio.batches(aio.chunks(reader), kind='interval',
+    ...         executor=executor):
+    ...     process(values)
+
+Requires Python 3.6+.
+"""
+import asyncio
+from iso8601utils import parsers
+
+
+# The parser of each kind, returning None for invalid input.
+kinds = {
+    'time': parsers.try_time,
+    'date': parsers.try_date,
+    'datetime': parsers.try_datetime,
+    'duration': parsers.try_duration,
+}
+
+
+async def chunks(reader, size=65536):
+    """Generate the chunks of bytes read from an asyncio.StreamReader
+    until end of file.
+    :param reader: An asyncio.StreamReader.
+    :param size: The maximum number of bytes per chunk.
+    :return: async generator of bytes
+    """
+    while True:
+        chunk = await reader.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def lines(chunks):
+    """Generate lists of the complete lines in an async iterator of byte
+    chunks, without line endings (\\n or \\r\\n). A line is yielded once
+    the chunk holding its end arrives; an unterminated last line is
+    yielded at the end of the source.
+    :param chunks: An async iterator of bytes.
+    :return: async generator of lists of bytes
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        end = buffer.rfind(b'\n')
+        if end < 0:
+            continue
+        complete = bytes(buffer[:end]).split(b'\n')
+        del buffer[:end + 1]
+        yield [line[:-1] if line.endswith(b'\r') else line for line in complete]
+    if buffer:
+        yield [bytes(buffer[:-1] if buffer.endswith(b'\r') else buffer)]
+
+
+async def batches(chunks, kind='datetime', errors='none', batch_size=1000, executor=None,
+        offload=100, now=None, designator='/'):
+    """Generate lists of up to batch_size values parsed from each line of
+    an async iterator of byte chunks, as soon as their lines are complete.
+    :param chunks: An async iterator of bytes, e.g. chunks(reader).
+    :param kind: 'time', 'date', 'datetime', 'duration' or 'interval'.
+    :param errors: 'raise', 'skip' or 'none', as for parsers.batch.
+    :param batch_size: The maximum number of lines parsed at a time.
+    :param executor: A concurrent.futures executor parsing batches of at
+    least offload lines, so that the event loop keeps running meanwhile.
+    None parses every batch on the event loop.
+    :param offload: The least number of lines worth sending to executor.
+    :param now: As for parsers.interval.
+    :param designator: As for parsers.interval.
+    :return: async generator of lists of parsed values
+    :raises: ValueError if errors is 'raise' and a line is invalid.
+    """
+    parsers.check_errors(errors)
+    if kind != 'interval' and kind not in kinds:
+        raise ValueError('Invalid ISO 8601 kind %s.' % kind)
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1.')
+
+    loop = asyncio.get_event_loop()
+    line = 0
+    async for complete in lines(chunks):
+        for start in range(0, len(complete), batch_size):
+            batch = complete[start:start + batch_size]
+            if executor is not None and len(batch) >= offload:
+                values = await loop.run_in_executor(executor, parse, kind, batch, now, designator)
+            else:
+                values = parse(kind, batch, now, designator)
+            if errors != 'none':
+                if errors == 'raise':
+                    for (index, value) in enumerate(values, line + 1):
+                        if value is None:
+                            raise ValueError('Invalid ISO 8601 %s on line %d.' % (kind, index))
+                values = [value for value in values if value is not None]
+            line += len(batch)
+            if values:
+                yield values
+
+
+async def scan(chunks, **kwargs):
+    """Generate the values of batches one at a time.
+    :param chunks: An async iterator of bytes.
+    :param kwargs: As for batches.
+    :return: async generator of parsed values
+    """
+    async for values in batches(chunks, **kwargs):
+        for value in values:
+            yield value
+
+
+def parse(kind, lines, now=None, designator='/'):
+    """Parse a list of lines as values of kind, with None for invalid
+    lines. Runs in the executor of batches.
+    """
+    if kind == 'interval':
+        return [parsers.try_interval(line, now, designator) for line in lines]
+    build = kinds[kind]
+    return [build(line) for line in lines]
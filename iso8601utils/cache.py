@@ -0,0 +1,127 @@
+"""Opt-in LRU caches in front of the parsers and validators, for
+inputs where the same strings repeat heavily.
+
+    >>> from iso8601utils import cache
+    >>> parsers = cache.parsers(maxsize=4096)
+    >>> parsers.duration('PT5M')
+    iso8601utils.duration(PT5M)
+    >>> parsers.info()['duration']
+    CacheInfo(hits=0, misses=1, maxsize=4096, currsize=1)
+"""
+from collections import OrderedDict, namedtuple
+from iso8601utils import parsers as parsers_, validators as validators_
+from iso8601utils.helpers.builder import literal
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+names = ('time', 'date', 'datetime', 'duration', 'interval')
+
+
+def key(string):
+    """Return bytearray and memoryview input as bytes, which can be hashed."""
+    if isinstance(string, bytearray):
+        return bytes(string)
+    if isinstance(string, memoryview):
+        return string.tobytes()
+    return string
+
+
+def explicit(interval):
+    """Whether the string interval has a start or an end, so that its value
+    does not depend on the time it is parsed at. Intervals given only by a
+    duration, such as P1D or R5/P1D, end at now.
+    """
+    components = interval.split(literal(interval, '/'))
+    return len(components) == 3 or (len(components) == 2 and
+        not components[0].upper().startswith(literal(interval, 'R')))
+
+
+class lru(object):
+    """Wrap function of a single string with a least recently used cache
+    keyed on the string, with bytearray and memoryview input keyed as
+    bytes. Calls with extra arguments, unhashable strings and strings for
+    which cacheable returns False bypass the cache, and exceptions are not
+    cached. Cached values are shared between callers, which is safe as
+    everything the parsers return is immutable.
+    """
+    def __init__(self, function, maxsize=1024, cacheable=None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+        self.function = function
+        self.maxsize = maxsize
+        self.cacheable = cacheable
+        self.hits = 0
+        self.misses = 0
+        self.cache = OrderedDict()
+
+    def __call__(self, string, *args, **kwargs):
+        if args or kwargs:
+            return self.function(string, *args, **kwargs)
+        string = key(string)
+        if self.cacheable is not None:
+            try:
+                if not self.cacheable(string):
+                    return self.function(string)
+            except (TypeError, AttributeError):
+                return self.function(string)
+        cache = self.cache
+        try:
+            value = cache.pop(string)
+            self.hits += 1
+        except TypeError:
+            # unhashable
+            return self.function(string)
+        except KeyError:
+            value = self.function(string)
+            self.misses += 1
+            if len(cache) >= self.maxsize:
+                cache.popitem(last=False)
+        cache[string] = value
+        return value
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.cache))
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class cached(object):
+    """A set of lru wrapped functions of module, available as attributes
+    under their original names.
+    """
+    def __init__(self, module, names, maxsize=1024, cacheable=None):
+        cacheable = cacheable or {}
+        self.functions = {name: lru(getattr(module, name), maxsize, cacheable.get(name))
+            for name in names}
+        for name, function in self.functions.items():
+            setattr(self, name, function)
+
+    def info(self):
+        return {name: function.info() for name, function in self.functions.items()}
+
+    def clear(self):
+        for function in self.functions.values():
+            function.clear()
+
+
+def parsers(maxsize=1024):
+    """Return cached time, date, datetime, duration and interval parsers.
+    Intervals without a start or an end, which end at the time they are
+    parsed, are not cached.
+    :param maxsize: The maximum number of strings cached per parser.
+    :return: iso8601utils.cache.cached
+    """
+    return cached(parsers_, names, maxsize, {'interval': explicit})
+
+
+def validators(maxsize=1024):
+    """Return cached time, date, datetime, duration and interval validators.
+    :param maxsize: The maximum number of strings cached per validator.
+    :return: iso8601utils.cache.cached
+    """
+    return cached(validators_, names, maxsize)
@@ -2,6 +2,7 @@ from collections import Iterable
 from datetime import datetime, timedelta
 from enum import Enum
 from monthdelta import MonthDelta as monthdelta
+from iso8601utils.helpers.format import duration_alternative, duration_designators, duration_week
 
 try:
     from itertools import izip as zip
@@ -9,48 +10,129 @@ except:
     pass
 
 
+# The average Gregorian month, 365.2425 / 12 days, in microseconds.
+MONTH_MICROSECONDS = 2629746 * 10**6
+
+
+DAY_MICROSECONDS = 86400 * 10**6
+
+
+# The largest number of days a timedelta can hold.
+MAX_DAYS = 999999999
+
+
+# The positional arguments of duration, in order.
+FIELDS = ('years', 'months', 'days', 'hours', 'minutes', 'seconds')
+
+
+def ordering(months, days, microseconds):
+    """Order durations by their length with every month counted as an
+    average Gregorian month, then by their month component so that only
+    equal durations have equal keys.
+    """
+    return (days * DAY_MICROSECONDS + microseconds + months * MONTH_MICROSECONDS, months)
+
+
+def deltas(years=0, months=0, days=0, hours=0, minutes=0, seconds=0):
+    return (timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds),
+        int(months + 12 * years))
+
+
+def week_delta(weeks):
+    return (timedelta(weeks=weeks), 0)
+
+
 class duration(Iterable):
     Format = Enum('Format', 'DURATION BASIC EXTENDED WEEK')
 
-    def __init__(self, *args, **kwargs):
-        def resolve_args(args, kwargs):
-            keys = ['years', 'months', 'days', 'hours', 'minutes', 'seconds']
-            for k, v in zip(keys, args):
-                if k in kwargs:
-                    raise ValueError('\'%s\' already provided as a positional argument.' % k)
-                kwargs[k] = v
-            return kwargs
-
-        def create_deltas(years=0, months=0, days=0, hours=0, minutes=0, seconds=0):
-            td = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-            md = monthdelta(int(months + 12 * years))
-            return (td, md)
-
-        def create_week_delta(weeks):
-            return (timedelta(weeks=weeks), monthdelta(0))
+    # A duration is held as integer months, days and microseconds of the
+    # day (0 <= microseconds < 86400 * 10**6, normalised as by timedelta),
+    # so that arithmetic is integer math. The timedelta and monthdelta
+    # views are built when asked for. Instances are immutable and have
+    # no __dict__: 72 bytes each on 64-bit CPython 3.9.
+    __slots__ = ('_months', '_days', '_microseconds', 'print_format', '_sort_key')
 
+    def __init__(self, *args, **kwargs):
         if len(args) == 0 and ('weeks' in kwargs):
-            self.print_format = self.Format.WEEK
-            try:
-                (self.timedelta, self.monthdelta) = create_week_delta(**kwargs)
-            except Exception as e:
-                raise e
+            print_format = self.Format.WEEK
+            (td, months) = week_delta(**kwargs)
         else:
-            self.print_format = self.Format.DURATION
+            print_format = self.Format.DURATION
             if len(args) == 0 and len(kwargs) == 2 and ('timedelta' in kwargs) and ('monthdelta' in kwargs):
-                self.timedelta = kwargs['timedelta']
-                self.monthdelta = kwargs['monthdelta']
+                (td, months) = (kwargs['timedelta'], kwargs['monthdelta'].months)
             else:
-                try:
-                    (self.timedelta, self.monthdelta) = create_deltas(**resolve_args(args, kwargs))
-                except Exception as e:
-                    raise e
+                for k, v in zip(FIELDS, args):
+                    if k in kwargs:
+                        raise ValueError('\'%s\' already provided as a positional argument.' % k)
+                    kwargs[k] = v
+                (td, months) = deltas(**kwargs)
+        set_months(self, months)
+        set_days(self, td.days)
+        set_microseconds(self, td.seconds * 10**6 + td.microseconds)
+        set_print_format(self, print_format)
+
+    @classmethod
+    def _from_ints(cls, months, days, microseconds, print_format=None):
+        """Create a duration directly from integer months, days and
+        microseconds, normalising the microseconds into days, without
+        going through the keyword arguments of __init__.
+        :raises: OverflowError if the days do not fit a timedelta.
+        """
+        if not 0 <= microseconds < DAY_MICROSECONDS:
+            (extra, microseconds) = divmod(microseconds, DAY_MICROSECONDS)
+            days += extra
+        if not -MAX_DAYS <= days <= MAX_DAYS:
+            raise OverflowError('days=%d; must have magnitude <= %d' % (days, MAX_DAYS))
+        self = object.__new__(cls)
+        set_months(self, months)
+        set_days(self, days)
+        set_microseconds(self, microseconds)
+        set_print_format(self, print_format or DURATION)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError('duration is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('duration is immutable.')
+
+    def __getstate__(self):
+        return (self._months, self._days, self._microseconds, self.print_format.name)
+
+    def __setstate__(self, state):
+        if len(state) == 3:
+            # (timedelta, monthdelta, format) as pickled by earlier versions.
+            (td, md, print_format) = state
+            state = (md.months, td.days, td.seconds * 10**6 + td.microseconds, print_format)
+        (months, days, microseconds, print_format) = state
+        set_months(self, months)
+        set_days(self, days)
+        set_microseconds(self, microseconds)
+        set_print_format(self, self.Format[print_format])
+
+    @property
+    def timedelta(self):
+        return timedelta(self._days, 0, self._microseconds)
+
+    @property
+    def monthdelta(self):
+        return monthdelta(self._months)
+
+    @property
+    def sort_key(self):
+        """A deterministic total order key, computed on first use."""
+        try:
+            return self._sort_key
+        except AttributeError:
+            key = ordering(self._months, self._days, self._microseconds)
+            set_sort_key(self, key)
+            return key
 
     @staticmethod
     def from_datetimes(start, end):
-        (td, md) = (end.replace(month=start.month, year=start.year) - start,
-            monthdelta((end.month - start.month) + 12 * (end.year - start.year)))
-        return duration(timedelta=td, monthdelta=md)
+        td = end.replace(month=start.month, year=start.year) - start
+        return duration._from_ints((end.month - start.month) + 12 * (end.year - start.year),
+            td.days, td.seconds * 10**6 + td.microseconds)
 
     def string(self, print_format=None):
         _format = print_format or self.print_format
@@ -62,8 +144,7 @@ class duration(Iterable):
             return self.datetime_format(print_format)
 
     def week_format(self):
-        weeks = self.timedelta.days // 7
-        return 'P%iW' % weeks
+        return duration_week(self._days)
 
     def components(self):
         return (self.monthdelta.months / 12, self.monthdelta.months % 12,
@@ -72,35 +153,12 @@ class duration(Iterable):
             self.timedelta.total_seconds())
 
     def duration_format(self):
-        (years, months, days, hours, minutes, seconds, total_seconds) = self.components()
-
-        y = '%iY' % years if years else ''
-        mo = '%iM' % months if months else ''
-        d = '%iD' % days if days else ''
-        h = '%iH' % hours if hours else ''
-        m = '%iM' % minutes if minutes else ''
-        ms = str(total_seconds).split('.')[1].rstrip('0')
-        s = '%01d' % seconds if seconds else ''
-        div = '.' if ms else ''
-        secs = 'S' if s or ms else ''
-
-        return 'P%s%s%sT%s%s%s%s%s%s' % (y, mo, d, h, m, s, div, ms, secs)
+        return duration_designators(self._months, self._days, self._microseconds)
 
     def datetime_format(self, print_format=None):
         _format = print_format or self.print_format
-        (years, months, days, hours, minutes, seconds, microseconds) = self.components()
-
-        y = '%04d' % years
-        mo = '%02d' % months
-        d = '%02d' % days
-        h = '%02d' % hours
-        m = '%02d' % minutes
-        s = '%02d.%s' % (seconds, str(float(microseconds) / 10**6)[2:5].rstrip('0')) if microseconds else '%02d' % seconds
-
-        if _format == self.Format.BASIC: 
-            return 'P%s%s%sT%s%s%s' % (y, mo, d, h, m, s)
-        else:
-            return 'P%s-%s-%sT%s:%s:%s' % (y, mo, d, h, m, s)
+        return duration_alternative(self._months, self._days, self._microseconds,
+            _format == self.Format.BASIC)
 
     def __iter__(self):
         yield self.timedelta
@@ -114,21 +172,24 @@ class duration(Iterable):
 
     def __add__(self, other):
         if isinstance(other, duration):
-            return duration(timedelta=(self.timedelta + other.timedelta),
-                monthdelta=(self.monthdelta + other.monthdelta))
+            return duration._from_ints(self._months + other._months, self._days + other._days,
+                self._microseconds + other._microseconds)
         if isinstance(other, datetime):
             return other + self.timedelta + self.monthdelta
         return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, duration):
-            return duration(timedelta=(self.timedelta - other.timedelta),
-                monthdelta=(self.monthdelta - other.monthdelta))
+            return duration._from_ints(self._months - other._months, self._days - other._days,
+                self._microseconds - other._microseconds)
         if isinstance(other, datetime):
             return other - self.timedelta - self.monthdelta
         return NotImplemented
 
     def __mul__(self, other):
+        if isinstance(other, int):
+            return duration._from_ints(self._months * other, self._days * other,
+                self._microseconds * other)
         return duration(timedelta=(other * self.timedelta),
             monthdelta=(other * self.monthdelta))
 
@@ -137,6 +198,9 @@ class duration(Iterable):
             monthdelta=(self.monthdelta / other))
 
     def __floordiv__(self, other):
+        if isinstance(other, int):
+            return duration._from_ints(self._months // other, 0,
+                (self._days * DAY_MICROSECONDS + self._microseconds) // other)
         return duration(timedelta=(self.timedelta // other),
             monthdelta=(self.monthdelta // other))
 
@@ -150,56 +214,69 @@ class duration(Iterable):
         return self.__mul__(other)
 
     def __neg__(self):
-        return duration(timedelta=-self.timedelta, monthdelta=-self.monthdelta)
+        return duration._from_ints(-self._months, -self._days, -self._microseconds)
 
     def __pos__(self):
-        return duration(timedelta=self.timedelta, monthdelta=self.monthdelta)
+        return duration._from_ints(self._months, self._days, self._microseconds)
 
     def __abs__(self):
-        return duration(timedelta=abs(self.timedelta), monthdelta=abs(self.monthdelta))
+        if self._days < 0:
+            return duration._from_ints(abs(self._months), -self._days, -self._microseconds)
+        return duration._from_ints(abs(self._months), self._days, self._microseconds)
 
     def __bool__(self):
-        return bool(self.timedelta) and bool(self.monthdelta)
+        return bool(self._days or self._microseconds) and bool(self._months)
 
     def __eq__(self, other):
         if isinstance(other, duration):
-            return (self.timedelta == other.timedelta) and (self.monthdelta == other.monthdelta)
+            return (self._microseconds == other._microseconds and self._days == other._days and
+                self._months == other._months)
         else:
             return False
 
     def __ne__(self, other):
         if isinstance(other, duration):
-            return (self.timedelta != other.timedelta) or (self.monthdelta != other.monthdelta)
+            return (self._microseconds != other._microseconds or self._days != other._days or
+                self._months != other._months)
         else:
             return False
 
     def __ge__(self, other):
         if isinstance(other, duration):
-            now = datetime.now()
-            return now + self.timedelta + self.monthdelta >= now + other.timedelta + other.monthdelta
+            return self.sort_key >= other.sort_key
         else:
             return False
 
     def __gt__(self, other):
         if isinstance(other, duration):
-            now = datetime.now()
-            return now + self.timedelta + self.monthdelta > now + other.timedelta + other.monthdelta
+            return self.sort_key > other.sort_key
         else:
             return False
 
     def __le__(self, other):
         if isinstance(other, duration):
-            now = datetime.now()
-            return now + self.timedelta + self.monthdelta <= now + other.timedelta + other.monthdelta
+            return self.sort_key <= other.sort_key
         else:
             return False
 
     def __lt__(self, other):
         if isinstance(other, duration):
-            now = datetime.now()
-            return now + self.timedelta + self.monthdelta < now + other.timedelta + other.monthdelta
+            return self.sort_key < other.sort_key
         else:
             return False
 
     def __hash__(self):
-        return hash((self.timedelta, self.monthdelta))
+        return hash((self._months, self._days, self._microseconds))
+
+
+# The slot descriptors' setters write the fields of a new duration past
+# its __setattr__, which refuses every write, for less than the cost of
+# object.__setattr__.
+set_months = duration._months.__set__
+set_days = duration._days.__set__
+set_microseconds = duration._microseconds.__set__
+set_print_format = duration.print_format.__set__
+set_sort_key = duration._sort_key.__set__
+
+
+DURATION = duration.Format.DURATION
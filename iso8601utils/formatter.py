@@ -0,0 +1,97 @@
+"""Format datetimes, durations and intervals as ISO 8601 strings, one at
+a time or in bulk.
+
+    >>> from iso8601utils import formatter, parsers, duration
+    >>> formatter.datetime(parsers.datetime('2016-08-01T23:10:59.111Z'))
+    '2016-08-01T23:10:59.111000Z'
+    >>> formatter.format_many([parsers.datetime('2016-08-01T23:10:59.111+05:30'),
+    ...     parsers.duration('PT1.5S')], duration.Format.BASIC)
+    ['20160801T231059.111000+0530', 'P00000000T000001.5']
+"""
+from datetime import datetime as datetime_
+from iso8601utils import duration as duration_, interval as interval_
+from iso8601utils.helpers.format import datetime_basic, datetime_extended, datetime_week
+
+
+datetimes = {
+    None: datetime_extended,
+    duration_.Format.BASIC: datetime_basic,
+    duration_.Format.EXTENDED: datetime_extended,
+    duration_.Format.WEEK: datetime_week,
+}
+
+
+def datetime(datetime, format=None):
+    """Format a datetime.datetime as an ISO 8601 datetime.
+    :param datetime: A datetime.datetime.
+    :param format: duration.Format.BASIC, EXTENDED (the default) or WEEK.
+    :return: str
+    :raises: ValueError if format is not a datetime format.
+    """
+    return renderer(datetime_, format)(datetime)
+
+
+def duration(duration, format=None):
+    """Format a duration as an ISO 8601 duration.
+    :param duration: An iso8601utils.duration.
+    :param format: A duration.Format, defaulting to the format the
+    duration was created with.
+    :return: str
+    """
+    return duration.string(format)
+
+
+def interval(interval, format=None, datetime_format=None):
+    """Format an interval as an ISO 8601 interval.
+    :param interval: An iso8601utils.interval.
+    :param format: An interval.Format, defaulting to START_END.
+    :param datetime_format: duration.Format.BASIC, EXTENDED (the default)
+    or WEEK for the start and end.
+    :return: str
+    """
+    return interval.string(format, datetime_format)
+
+
+def renderer(kind, format=None):
+    """Return the function formatting values of class kind in format.
+    :raises: ValueError if there is no such function.
+    """
+    if issubclass(kind, datetime_):
+        try:
+            return datetimes[format]
+        except KeyError:
+            raise ValueError('Invalid datetime format %s.' % format)
+    if issubclass(kind, duration_):
+        return lambda value: value.string(format)
+    if issubclass(kind, interval_):
+        return lambda value: value.string(format)
+    raise ValueError('Cannot format %s as ISO 8601.' % kind.__name__)
+
+
+def format_many(values, format=None):
+    """Format a sequence of datetimes, durations and intervals, looking
+    up the formatting function once per run of values of the same class.
+    :param values: An iterable of datetime.datetime, iso8601utils.duration
+    and iso8601utils.interval objects, in any mix.
+    :param format: A duration.Format, applied to datetimes and durations,
+    or an interval.Format, applied to intervals. Values it does not apply
+    to use their default format.
+    :return: list of str
+    :raises: ValueError if a value cannot be formatted.
+    """
+    duration_format = format if isinstance(format, duration_.Format) else None
+    datetime_format = duration_format if duration_format in datetimes else None
+    interval_format = format if isinstance(format, interval_.Format) else None
+    results = []
+    kind = None
+    for value in values:
+        if type(value) is not kind:
+            kind = type(value)
+            if issubclass(kind, interval_):
+                render = renderer(kind, interval_format)
+            elif issubclass(kind, datetime_):
+                render = renderer(kind, datetime_format)
+            else:
+                render = renderer(kind, duration_format)
+        results.append(render(value))
+    return results
@@ -4,48 +4,210 @@ from iso8601utils.helpers import match as m
 from iso8601utils.tz import utc
 
 
-def builder(string, builders):
-    for (regex, builder) in builders:
-        match = regex.match(string)
+# Builders return None when string is not valid instead of raising, as
+# raising and catching exceptions dominates the cost of invalid input.
+# Only values that match the grammar but are out of range, such as
+# 2007-02-30, still raise inside the datetime constructors.
+#
+# Strings may be str, bytes or bytearray. Bytes-like strings are matched
+# by the bytes counterparts of the regexes, so they are never decoded.
+
+
+def literal(string, text):
+    """Return the str text as bytes if string is bytes-like."""
+    if isinstance(string, str) or not isinstance(text, str):
+        return text
+    return text.encode('ascii')
+
+
+def contiguous(string):
+    """Return a memoryview as bytes, as the builders need the string
+    methods memoryview lacks. Other strings are returned as they are.
+    """
+    return string.tobytes() if isinstance(string, memoryview) else string
+
+
+def builder(string, shape, builders):
+    """Classify string once by its shape and try only the
+    regex registered for that shape in builders.
+    """
+    entry = builders.get(shape(string))
+    if entry:
+        (regex, regex_bytes, builder) = entry
+        match = (regex if isinstance(string, str) else regex_bytes).match(string)
         if match:
-            return builder(match)
-    raise ValueError('Match not found.')
+            try:
+                return builder(match)
+            except (ValueError, OverflowError):
+                pass
+    return None
 
 
-def partial_builder(string, builders, other=None):
-    for (regex, builder) in builders:
-        match = regex.match(string)
+def partial_builder(string, shape, builders, other=None):
+    entry = builders.get(shape(string))
+    if entry:
+        (regex, regex_bytes, builder) = entry
+        match = (regex if isinstance(string, str) else regex_bytes).match(string)
         if match:
-            return builder(match, other)
-    raise ValueError('Match not found.')
+            try:
+                return builder(match, other)
+            except (ValueError, OverflowError):
+                pass
+    return None
+
+
+def date_shape(string):
+    """Return the only kind of date regex that can match string,
+    judging by a leading '--', a week designator, the position
+    of the first separator and the length.
+    """
+    if string[:2] in ('--', b'--'):
+        return 'no_year'
+    if string[4:5] in _week or string[5:6] in _week:
+        return 'week'
+    if string[4:5] in ('-', b'-'):
+        return _date_extended_shapes.get(len(string))
+    return _date_basic_shapes.get(len(string))
+
+
+_week = ('W', 'w', b'W', b'w')
+
+
+_date_extended_shapes = {7: 'calendar', 8: 'ordinal', 10: 'calendar'}
+
+
+_date_basic_shapes = {4: 'calendar', 6: 'calendar', 7: 'ordinal', 8: 'calendar'}
+
+
+def date_shape_partial(string):
+    return 'month_day' if len(string) <= 5 else 'calendar'
+
+
+def duration_shape(string):
+    """Durations in the alternative format are the only ones ending in
+    a digit and week durations the only ones ending in W.
+    """
+    last = string[-1:]
+    if last.isdigit():
+        return 'datetime'
+    if last in _week:
+        return 'week'
+    return 'standard'
+
 
+durations = {'standard': (r.duration_standard, r.duration_standard_bytes, m.duration),
+    'datetime': (r.duration_datetime, r.duration_datetime_bytes, m.duration),
+    'week': (r.duration_week, r.duration_week_bytes, m.duration_week)}
 
-duration_builder = lambda string: builder(string, zip(r.durations,
-    [m.duration, m.duration, m.duration_week]))
 
+dates = {'calendar': (r.date_calendar, r.date_calendar_bytes, m.date),
+    'no_year': (r.date_calendar_no_year, r.date_calendar_no_year_bytes, m.date),
+    'week': (r.date_week, r.date_week_bytes, m.date_week),
+    'ordinal': (r.date_ordinal, r.date_ordinal_bytes, m.date_ordinal)}
 
-time_builder = lambda string: builder(string, [(r.time, m.time)])
 
+dates_strict = {'calendar': (r.date_calendar_strict, r.date_calendar_strict_bytes, m.date),
+    'week': (r.date_week_strict, r.date_week_strict_bytes, m.date_week),
+    'ordinal': (r.date_ordinal, r.date_ordinal_bytes, m.date_ordinal)}
 
-date_builder = lambda string: builder(string, zip(r.dates,
-    [m.date, m.date, m.date_week, m.date_ordinal]))
 
+dates_partial = {'calendar': (r.date_calendar_partial_0, r.date_calendar_partial_0_bytes, m.date),
+    'month_day': (r.date_calendar_partial_1, r.date_calendar_partial_1_bytes, m.date)}
 
-date_builder_strict = lambda string, other=None: builder(string, zip(r.dates_strict,
-    [m.date, m.date, m.date_week, m.date_ordinal]))
 
-date_builder_partial = lambda string, other=None: partial_builder(string, zip(r.dates_partial,
-    [m.date, m.date]), other)
+duration_builder = lambda string: builder(string, duration_shape, durations)
+
+
+def time_builder(string):
+    match = (r.time if isinstance(string, str) else r.time_bytes).match(string)
+    if match:
+        try:
+            return m.time(match)
+        except (ValueError, OverflowError):
+            pass
+    return None
+
+
+date_builder = lambda string: builder(string, date_shape, dates)
+
+
+date_builder_strict = lambda string, other=None: builder(string, date_shape, dates_strict)
+
+
+date_builder_partial = lambda string, other=None: partial_builder(string, date_shape_partial,
+    dates_partial, other)
+
+
+# The characters datetime_builder_fast looks for: the separators at
+# offsets 4, 7, 10, 13 and 16, Z, the offset signs, the offset colon
+# and the decimal marks.
+_fast = ('--T::', 'Z', '+-', ':', '.,')
+_fast_bytes = tuple(symbols.encode('ascii') for symbols in _fast)
+
+
+def datetime_builder_fast(string):
+    """Build a datetime from the fixed-width YYYY-MM-DDThh:mm:ss[(.|,)s+][Z|±hh:mm]
+    shape by slicing the digits at known positions. Returns None if string
+    has any other shape so that the caller can fall back to the regexes,
+    and raises ValueError if it has this shape but values out of range.
+    """
+    if len(string) < 19:
+        return None
+    (separators, zulu, signs, colon, decimals) = (_fast if isinstance(string, str)
+        else _fast_bytes)
+    if string[4:5] + string[7:8] + string[10:11] + string[13:14] + string[16:17] != separators:
+        return None
+    if not (string[0:4] + string[5:7] + string[8:10] + string[11:13] +
+            string[14:16] + string[17:19]).isdigit():
+        return None
+
+    rest = string[19:]
+    tz = utc
+    if rest.endswith(zulu):
+        rest = rest[:-1]
+    elif len(rest) >= 6 and rest[-6:-5] in signs and rest[-3:-2] == colon:
+        offset_hour, offset_minute = rest[-5:-3], rest[-2:]
+        if not (offset_hour + offset_minute).isdigit():
+            return None
+        (offset_hour, offset_minute) = (int(offset_hour), int(offset_minute))
+        if offset_hour > 23 or offset_minute > 59:
+            return None
+        tz = m.offset(rest[-6:-5], offset_hour, offset_minute)
+        rest = rest[:-6]
+
+    millisecond = 0
+    if rest:
+        if rest[:1] not in decimals or not rest[1:].isdigit():
+            return None
+        millisecond = int(rest[1:])
+
+    hour, minute, second = int(string[11:13]), int(string[14:16]), int(string[17:19])
+    if hour == 24 and minute == second == millisecond == 0:
+        return datetime_(int(string[0:4]), int(string[5:7]), int(string[8:10]),
+            0, 0, 0, 0, tz) + timedelta(days=1)
+    return datetime_(int(string[0:4]), int(string[5:7]), int(string[8:10]),
+        hour, minute, second, 1000 * millisecond, tz)
 
 
 def datetime_builder(string):
     try:
-        [date, time] = string.split('T')
-        (t, extra_day, _) = time_builder(time)
-        d = date_builder(date) + timedelta(days=extra_day)
-        return datetime_.combine(d, t)
-    except Exception as e:
-        raise ValueError('Parsing failed.')
+        value = datetime_builder_fast(string)
+    except (ValueError, OverflowError):
+        return None
+    if value is not None:
+        return value
+    components = string.split(literal(string, 'T'))
+    if len(components) != 2:
+        return None
+    time = time_builder(components[1])
+    date = date_builder(components[0])
+    if time is None or date is None:
+        return None
+    (t, extra_day, _) = time
+    try:
+        return datetime_.combine(date + timedelta(days=extra_day), t)
+    except OverflowError:
+        return None
 
 
 def datetime_builder_partial(string, delta=None, other=None, strict=False):
@@ -64,36 +226,38 @@ def datetime_builder_partial(string, delta=None, other=None, strict=False):
         selected_builder = date_builder_partial
 
     # date and time components
-    components = string.split('T')
+    components = string.split(literal(string, 'T'))
     length = len(components)
     if length == 2:
+        time = time_builder(components[1])
+        date = selected_builder(components[0], other)
+        if time is None or date is None:
+            return None
+        (t, extra_day, explicit_tz) = time
+        t = resolve_tz(t, other, explicit_tz)
         try:
-            [date, time] = components
-            (t, extra_day, explicit_tz) = time_builder(time)
-            print('EXPLICIT: %s' % explicit_tz)
-            t = resolve_tz(t, other, explicit_tz)
-            d = selected_builder(date, other) + timedelta(days=extra_day)
-            return datetime_.combine(d, t)
-        except:
-            raise ValueError('Parsing failed.')
+            return datetime_.combine(date + timedelta(days=extra_day), t)
+        except OverflowError:
+            return None
     elif length == 1:
         # only date component
-        try:
-            if delta:
-                d = selected_builder(string, other) + delta
-            else:
-                d = selected_builder(string, other)
-            return resolve_tz(datetime_.combine(d, time_(0, tzinfo=utc)), other)
-        # only time component
-        except:
+        d = selected_builder(string, other)
+        if d is not None:
             try:
-                (t, extra_day, explicit_tz) = time_builder(string)
-                t = resolve_tz(t, other, explicit_tz)
-                return datetime_.combine(other.date(), t)
-            except:
-                raise ValueError('Parsing failed.')
+                if delta:
+                    d = d + delta
+                return resolve_tz(datetime_.combine(d, time_(0, tzinfo=utc)), other)
+            except OverflowError:
+                pass
+        # only time component
+        time = time_builder(string)
+        if time is None or other is None:
+            return None
+        (t, extra_day, explicit_tz) = time
+        t = resolve_tz(t, other, explicit_tz)
+        return datetime_.combine(other.date(), t)
     else:
-        raise ValueError('Parsing failed.')
+        return None
 
 
 def interval_datetimes_builder(start, end):
@@ -101,20 +265,18 @@ def interval_datetimes_builder(start, end):
     in missing values with values from other. Need to keep track
     of possible extra_day returned from time_builder(start)
     """
-    try:
-        s = datetime_builder_partial(start, strict=True)
-        e = datetime_builder_partial(end, timedelta(1), s)
-        if e > s:
-            return (s, e)
-        else:
-            raise ValueError('Parsing failed: end < start.')
-    except:
-        raise ValueError('Parsing failed.')
+    s = datetime_builder_partial(start, strict=True)
+    if s is None:
+        return None
+    e = datetime_builder_partial(end, timedelta(1), s)
+    if e is None or e <= s:
+        return None
+    return (s, e)
 
 
 def repeat_builder(repeat):
-    try:
-        value = r.repeat.match(repeat).groupdict().get('repeat')
-        return int(value) if value else float('inf')
-    except:
-        raise ValueError('Parsing failed.')
+    match = (r.repeat if isinstance(repeat, str) else r.repeat_bytes).match(repeat)
+    if match is None:
+        return None
+    value = match.group('repeat')
+    return int(value) if value else float('inf')
@@ -0,0 +1,15 @@
+from datetime import datetime
+from iso8601utils.tz import utc
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=utc)
+
+
+def microseconds(delta):
+    """Return the length of a timedelta in whole microseconds."""
+    return (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+
+
+def epoch_microseconds(value):
+    """Return microseconds from the Unix epoch to an aware datetime."""
+    return microseconds(value - EPOCH)
@@ -0,0 +1,112 @@
+"""Render datetimes, durations and intervals as ISO 8601 strings. Every
+fixed width field is looked up in a precomputed table of two digit
+strings instead of going through strftime or a '%02d' format per field.
+"""
+
+
+DIGITS = tuple('%02d' % i for i in range(100))
+
+
+def fraction(microseconds):
+    """Return the six digits of microseconds."""
+    return (DIGITS[microseconds // 10000] + DIGITS[microseconds // 100 % 100] +
+        DIGITS[microseconds % 100])
+
+
+def year(value):
+    return DIGITS[value // 100] + DIGITS[value % 100]
+
+
+def offset_basic(value):
+    """Return the timezone of an aware datetime as Z or ±hhmm, or an
+    empty string for a naive datetime.
+    """
+    offset = value.utcoffset()
+    if offset is None:
+        return ''
+    if not offset and value.tzname() == 'Z':
+        return 'Z'
+    seconds = offset.days * 86400 + offset.seconds
+    sign = '-' if seconds < 0 else '+'
+    (hours, minutes) = divmod(abs(seconds) // 60, 60)
+    return sign + DIGITS[hours] + DIGITS[minutes]
+
+
+def datetime_extended(value):
+    """YYYY-MM-DDThh:mm:ss.ffffff followed by the timezone name, the
+    same string as strftime('%Y-%m-%dT%H:%M:%S.%f%Z').
+    """
+    return '%s-%s-%sT%s:%s:%s.%s%s' % (year(value.year), DIGITS[value.month],
+        DIGITS[value.day], DIGITS[value.hour], DIGITS[value.minute],
+        DIGITS[value.second], fraction(value.microsecond), value.tzname() or '')
+
+
+def datetime_basic(value):
+    """YYYYMMDDThhmmss.ffffff followed by Z or ±hhmm."""
+    return '%s%s%sT%s%s%s.%s%s' % (year(value.year), DIGITS[value.month],
+        DIGITS[value.day], DIGITS[value.hour], DIGITS[value.minute],
+        DIGITS[value.second], fraction(value.microsecond), offset_basic(value))
+
+
+def datetime_week(value):
+    """YYYY-Www-DThh:mm:ss.ffffff followed by the timezone name."""
+    (year_, week, day) = value.isocalendar()
+    return '%s-W%s-%dT%s:%s:%s.%s%s' % (year(year_), DIGITS[week], day,
+        DIGITS[value.hour], DIGITS[value.minute], DIGITS[value.second],
+        fraction(value.microsecond), value.tzname() or '')
+
+
+def components(months, days, microseconds):
+    """Split months, days and microseconds of the day into years,
+    months, days, hours, minutes, seconds and microseconds. Years and
+    months carry the sign of the months.
+    """
+    (years, months_) = divmod(abs(months), 12)
+    if months < 0:
+        (years, months_) = (-years, -months_)
+    (seconds, microseconds) = divmod(microseconds, 10**6)
+    return (years, months_, days, seconds // 3600, seconds // 60 % 60,
+        seconds % 60, microseconds)
+
+
+def duration_designators(months, days, microseconds):
+    """PnYnMnDTnHnMnS, leaving out zero components."""
+    (years, months, days, hours, minutes, seconds, microseconds) = components(months,
+        days, microseconds)
+    parts = ['P']
+    if years:
+        parts.append('%dY' % years)
+    if months:
+        parts.append('%dM' % months)
+    if days:
+        parts.append('%dD' % days)
+    parts.append('T')
+    if hours:
+        parts.append('%dH' % hours)
+    if minutes:
+        parts.append('%dM' % minutes)
+    if seconds:
+        parts.append('%d' % seconds)
+    if microseconds:
+        parts.append('.' + fraction(microseconds).rstrip('0'))
+    if seconds or microseconds:
+        parts.append('S')
+    return ''.join(parts)
+
+
+def duration_alternative(months, days, microseconds, basic=False):
+    """PYYYY-MM-DDThh:mm:ss[.f], or PYYYYMMDDThhmmss[.f] if basic."""
+    (years, months, days, hours, minutes, seconds, microseconds) = components(months,
+        days, microseconds)
+    s = DIGITS[seconds]
+    if microseconds:
+        s += '.' + fraction(microseconds).rstrip('0')
+    if basic:
+        return 'P%04d%02d%02dT%s%s%s' % (years, months, days,
+            DIGITS[hours], DIGITS[minutes], s)
+    return 'P%04d-%02d-%02dT%s:%s:%s' % (years, months, days,
+        DIGITS[hours], DIGITS[minutes], s)
+
+
+def duration_week(days):
+    return 'P%dW' % (days // 7)
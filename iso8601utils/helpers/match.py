@@ -1,24 +1,25 @@
-from calendar import isleap
 from datetime import timedelta, date as date_, time as time_, datetime
 from monthdelta import MonthDelta as monthdelta
-from iso8601utils.tz import timezone, utc
+from iso8601utils.tz import fixed, utc
 from iso8601utils import duration as duration_
 
 
+def offset(sign, hours, minutes):
+    if hours == minutes == 0:
+        raise ValueError('Invalid timezone offset {0}00:00.'.format(sign))
+
+    if sign in ('+', b'+'):
+        return fixed(hours, minutes)
+    else:
+        return fixed(-hours, -minutes)
+
+
 def time(match):
     group = match.groupdict()
     data = {k: int(v or 0) for k, v in group.items() if k != 'sign'}
     sign = group.get('sign')
     if sign:
-        hours = data['offset_hour']
-        minutes = data['offset_minute']
-        if hours == minutes == 0:
-            raise ValueError('Invalid timezone offset {0}00:00.'.format(sign))
-
-        if sign == '+':
-            tz = timezone(hours=hours, minutes=minutes)
-        else:
-            tz = -timezone(hours=hours, minutes=minutes)
+        tz = offset(sign, data['offset_hour'], data['offset_minute'])
         explicit_tz = True
     else:
         explicit_tz = False
@@ -54,7 +55,9 @@ def date_ordinal(match, other=None):
 
 
 def days_in_year(year):
-    return 366 if isleap(int(year)) else 365
+    # calendar.isleap, without importing calendar and with it locale.
+    year = int(year)
+    return 366 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 365
 
 
 def date_week(match, other=None):
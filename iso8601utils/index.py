@@ -0,0 +1,188 @@
+from random import random
+from iso8601utils import interval as interval_
+from iso8601utils import parsers
+
+
+class node(object):
+    """A treap node holding every indexed interval with the same
+    (start, end), augmented with the largest end in its subtree.
+    """
+    __slots__ = ('key', 'end', 'items', 'priority', 'left', 'right', 'max_end')
+
+    def __init__(self, key, item):
+        self.key = key
+        self.end = key[1]
+        self.items = [item]
+        self.priority = random()
+        self.left = None
+        self.right = None
+        self.max_end = self.end
+
+
+def update(node):
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def rotate_right(node):
+    left = node.left
+    node.left = left.right
+    update(node)
+    left.right = node
+    update(left)
+    return left
+
+
+def rotate_left(node):
+    right = node.right
+    node.right = right.left
+    update(node)
+    right.left = node
+    update(right)
+    return right
+
+
+def insert(node_, key, item):
+    if node_ is None:
+        return node(key, item)
+    if key == node_.key:
+        node_.items.append(item)
+        return node_
+    if key < node_.key:
+        node_.left = insert(node_.left, key, item)
+        if node_.left.priority > node_.priority:
+            return rotate_right(node_)
+    else:
+        node_.right = insert(node_.right, key, item)
+        if node_.right.priority > node_.priority:
+            return rotate_left(node_)
+    update(node_)
+    return node_
+
+
+def merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = merge(left.right, right)
+        update(left)
+        return left
+    right.left = merge(left, right.left)
+    update(right)
+    return right
+
+
+def remove(node_, key, item):
+    if node_ is None:
+        raise KeyError('Interval not in index.')
+    if key == node_.key:
+        try:
+            node_.items.remove(item)
+        except ValueError:
+            raise KeyError('Interval not in index.')
+        return node_ if node_.items else merge(node_.left, node_.right)
+    if key < node_.key:
+        node_.left = remove(node_.left, key, item)
+    else:
+        node_.right = remove(node_.right, key, item)
+    update(node_)
+    return node_
+
+
+class IntervalIndex(object):
+    """An index over interval objects answering which intervals contain
+    a datetime and which overlap a range, treating each interval as
+    half-open [start, end). Backed by a treap ordered on (start, end) and
+    augmented with the largest end of each subtree: inserts and removals
+    take expected O(log n) and queries skip every subtree that ends too
+    early or starts too late.
+    """
+    def __init__(self, intervals=()):
+        self.root = None
+        self.size = 0
+        for value in intervals:
+            self.insert(value)
+
+    def insert(self, value):
+        """Add an interval, or a string parsed with parsers.interval.
+        :return: The indexed iso8601utils.interval.
+        """
+        if not isinstance(value, interval_):
+            value = parsers.interval(value)
+        self.root = insert(self.root, (value.start, value.end), value)
+        self.size += 1
+        return value
+
+    def remove(self, value):
+        """Remove an interval equal to value.
+        :raises: KeyError if no such interval is indexed.
+        """
+        if not isinstance(value, interval_):
+            value = parsers.interval(value)
+        self.root = remove(self.root, (value.start, value.end), value)
+        self.size -= 1
+
+    def stab(self, t):
+        """Return the intervals containing t, ordered by (start, end).
+        :param t: A datetime.
+        :return: list of iso8601utils.interval
+        """
+        return self.query(t, t, True)
+
+    def overlap(self, start, end):
+        """Return the intervals overlapping [start, end), ordered by (start, end).
+        :param start: A datetime.
+        :param end: A datetime.
+        :return: list of iso8601utils.interval
+        """
+        return self.query(start, end, False)
+
+    def query(self, low, high, inclusive):
+        """Collect intervals ending after low and starting before high,
+        or at high if inclusive.
+        """
+        results = []
+
+        def collect(node):
+            if node is None or node.max_end <= low:
+                return
+            collect(node.left)
+            start = node.key[0]
+            if start < high or (inclusive and start == high):
+                if node.end > low:
+                    results.extend(node.items)
+                collect(node.right)
+
+        collect(self.root)
+        return results
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                for item in node.items:
+                    yield item
+                node = node.right
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        key = (value.start, value.end)
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return value in node.items
+            node = node.left if key < node.key else node.right
+        return False
@@ -0,0 +1,168 @@
+"""Opt-in instrumentation of the parsers: match and failure counts for
+every regex in helpers.regex and for the builders the parsers try in
+turn, and a histogram of the time taken by each parsers.* call. Nothing
+is wrapped until enable() is called and disable() puts the original
+functions back, so instrumentation costs nothing while it is off.
+
+    >>> from iso8601utils import instrument, parsers
+    >>> instrument.enable()
+    >>> parsers.date('2016-W43-1')
+    datetime.date(2016, 10, 24)
+    >>> instrument.snapshot().regexes['date_week']
+    Counts(hits=1, misses=0)
+    >>> instrument.disable()
+
+The wrappers replace module attributes, so functions imported by name
+before enable(), as in from iso8601utils.parsers import datetime, and
+the functions held by cache.parsers() objects are not timed. Counters
+are not locked and may undercount under concurrent use.
+"""
+import re
+import threading
+from collections import Counter, namedtuple
+from timeit import default_timer
+from iso8601utils import parsers
+from iso8601utils.helpers import builder, regex
+
+
+Counts = namedtuple('Counts', 'hits misses')
+
+
+Snapshot = namedtuple('Snapshot', 'regexes branches timings')
+
+
+# The parsers.* functions timed into histograms. Only the outermost
+# timed call is recorded: parsers.datetime calling parsers.try_datetime
+# counts once, as datetime.
+timed = ('time', 'date', 'datetime', 'duration', 'interval', 'parse', 'try_time', 'try_date',
+    'try_datetime', 'try_duration', 'try_interval', 'try_parse')
+
+
+# The builders the parsers call, counted as hits when they build a value
+# and misses when they return None: (module, name).
+branches = ((parsers, 'time_builder'), (parsers, 'date_builder'),
+    (parsers, 'datetime_builder'), (parsers, 'datetime_builder_partial'),
+    (parsers, 'duration_builder'), (parsers, 'repeat_builder'), (parsers, 'interval_kwargs'),
+    (builder, 'datetime_builder_fast'))
+
+
+regex_counts = {}
+branch_counts = {}
+histograms = {}
+hooks = []
+
+
+# The per thread flag set while a timed call is running.
+state = threading.local()
+
+
+# (object, attribute, value) to restore on disable.
+originals = []
+
+
+def enable():
+    """Start counting and timing. Does nothing if already enabled."""
+    if originals:
+        return
+    for (name, value) in sorted(vars(regex).items()):
+        if isinstance(value, regex.lazy):
+            match = re.compile(value.pattern, value.flags).match
+            replace(value, 'match', counter(regex_counts, name, match))
+            # Restore the compiled match rather than the lazy one.
+            originals[-1] = (value, 'match', match)
+    for (module, name) in branches:
+        replace(module, name, counter(branch_counts, name, getattr(module, name)))
+    for name in timed:
+        replace(parsers, name, timer(name, getattr(parsers, name)))
+
+
+def disable():
+    """Stop counting and timing, keeping the numbers so far."""
+    while originals:
+        (target, name, value) = originals.pop()
+        setattr(target, name, value)
+
+
+def enabled():
+    return bool(originals)
+
+
+def reset():
+    """Zero every counter and histogram."""
+    for counts in list(regex_counts.values()) + list(branch_counts.values()):
+        counts[:] = [0, 0]
+    for histogram in histograms.values():
+        histogram.clear()
+
+
+def register(hook):
+    """Call hook(name, seconds, ok) after every timed parsers.* call,
+    where ok is False if the call raised or returned None.
+    :param hook: A callable, e.g. one that forwards to a metrics client.
+    """
+    hooks.append(hook)
+
+
+def unregister(hook):
+    """:raises: ValueError if hook is not registered."""
+    hooks.remove(hook)
+
+
+def snapshot():
+    """Return a copy of the numbers so far.
+    :return: iso8601utils.instrument.Snapshot of regexes and branches,
+    dicts of name to Counts, and timings, a dict of parser name to a
+    histogram {upper bound in nanoseconds: calls}, where a call taking
+    t nanoseconds is counted under the least power of two above t.
+    """
+    return Snapshot({name: Counts(*counts) for (name, counts) in regex_counts.items()},
+        {name: Counts(*counts) for (name, counts) in branch_counts.items()},
+        {name: dict(sorted(histogram.items())) for (name, histogram) in histograms.items()})
+
+
+def replace(target, name, value):
+    originals.append((target, name, getattr(target, name)))
+    setattr(target, name, value)
+
+
+def counter(counters, name, function):
+    """Wrap function to count the calls returning a value as hits and
+    those returning None or raising as misses.
+    """
+    counts = counters.setdefault(name, [0, 0])
+
+    def wrapper(*args, **kwargs):
+        try:
+            value = function(*args, **kwargs)
+        except Exception:
+            counts[1] += 1
+            raise
+        counts[0 if value is not None else 1] += 1
+        return value
+
+    return wrapper
+
+
+def timer(name, function):
+    histogram = histograms.setdefault(name, Counter())
+
+    def wrapper(*args, **kwargs):
+        if getattr(state, 'timing', False):
+            return function(*args, **kwargs)
+        state.timing = True
+        ok = False
+        start = default_timer()
+        try:
+            value = function(*args, **kwargs)
+            ok = value is not None
+            return value
+        finally:
+            seconds = default_timer() - start
+            state.timing = False
+            histogram[1 << int(seconds * 1e9).bit_length()] += 1
+            for hook in hooks:
+                hook(name, seconds, ok)
+
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
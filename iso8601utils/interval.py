@@ -1,12 +1,28 @@
 from collections import Iterable
-from iso8601utils.duration import duration
+from datetime import timedelta
+from itertools import count
+from iso8601utils.duration import duration, MONTH_MICROSECONDS
+from iso8601utils.helpers.epoch import microseconds
+from iso8601utils.helpers.format import datetime_basic, datetime_extended, datetime_week
 from enum import Enum
 
 
+datetime_formats = {
+    duration.Format.BASIC: datetime_basic,
+    duration.Format.EXTENDED: datetime_extended,
+    duration.Format.WEEK: datetime_week,
+}
+
+
 class interval(Iterable):
     Format = Enum('Format', 'START_END START_DURATION DURATION_END DURATION')
     INFINITE = float('inf')
 
+    # Instances are immutable and have no __dict__: 64 bytes each on
+    # 64-bit CPython 3.9 against 152 bytes with a __dict__, not counting
+    # the datetimes and duration they reference.
+    __slots__ = ('start', 'end', 'duration', 'repeats')
+
     def __init__(self, **kwargs):
         valid_kwargs = set(('start', 'end', 'duration', 'repeats'))
         required_kwargs = set(('start', 'end', 'duration'))
@@ -20,38 +36,140 @@ class interval(Iterable):
             missing_kwargs = required_kwargs - set(kwargs)
             raise ValueError('Expecting %d of %s.' % (missing_count, ', '.join([k for k in missing_kwargs])))
         if 'start' in kwargs and 'end' in kwargs:
-            self.start = kwargs['start']
-            self.end = kwargs['end']
-            self.duration = duration.from_datetimes(self.start, self.end)
+            start = kwargs['start']
+            end = kwargs['end']
+            duration_ = duration.from_datetimes(start, end)
         elif 'start' in kwargs and 'duration' in kwargs:
-            self.start = kwargs['start']
-            self.duration = kwargs['duration']
-            self.end = self.start + self.duration.timedelta + self.duration.monthdelta
+            start = kwargs['start']
+            duration_ = kwargs['duration']
+            end = start + duration_.timedelta + duration_.monthdelta
         elif 'end' in kwargs and 'duration' in kwargs:
-            self.end = kwargs['end']
-            self.duration = kwargs['duration']
-            self.start = self.end - self.duration.timedelta - self.duration.monthdelta
-        self.repeats = kwargs.get('repeats', 0)
+            end = kwargs['end']
+            duration_ = kwargs['duration']
+            start = end - duration_.timedelta - duration_.monthdelta
+        repeats = kwargs.get('repeats', 0)
+
+        if repeats != self.INFINITE:
+            repeats = int(repeats)
+        self.__setstate__((start, end, duration_, repeats))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('interval is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('interval is immutable.')
+
+    def __getstate__(self):
+        return (self.start, self.end, self.duration, self.repeats)
+
+    def __setstate__(self, state):
+        (start, end, duration_, repeats) = state
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'end', end)
+        object.__setattr__(self, 'duration', duration_)
+        object.__setattr__(self, 'repeats', repeats)
+
+    def occurrences(self):
+        """Lazily generate the (start, end) pair of each occurrence,
+        stepping forward from start by duration. An interval without
+        repeats occurs once, Rn occurs n times and R/ indefinitely,
+        until the datetime range is exhausted.
+        """
+        if self.repeats == self.INFINITE:
+            indices = count(1)
+        else:
+            indices = range(1, max(self.repeats, 1) + 1)
+        start = self.start
+        for k in indices:
+            try:
+                end = self.step(k)
+            except OverflowError:
+                return
+            yield (start, end)
+            start = end
 
-        if self.repeats != self.INFINITE:
-            self.repeats = int(self.repeats)
+    def nth(self, k):
+        """Return the (start, end) pair of occurrence k, counting from 0.
+        :raises: IndexError if there is no occurrence k.
+        """
+        if k < 0 or k >= max(self.repeats, 1):
+            raise IndexError('Occurrence %d out of range.' % k)
+        return (self.step(k), self.step(k + 1))
+
+    def step(self, k):
+        """Return start moved by k times duration. Month components are
+        applied as a single monthdelta of k times the months rather than
+        k successive steps, so that end of month days do not drift.
+        """
+        td = self.duration.timedelta
+        md = self.duration.monthdelta
+        if md:
+            return self.start + td * k + md * k
+        return self.start + td * k
+
+    def locate(self, t):
+        """Return the occurrence containing t without stepping through the
+        occurrences before it: by integer division of the time since start
+        by the duration, or for durations with months from an estimate
+        counting average months, corrected by binary search over step(k).
+        :param t: A datetime, naive or aware like start.
+        :return: (k, start, end) of occurrence k, counting from 0, or None
+        if no occurrence contains t.
+        :raises: ValueError if the duration has a negative component.
+        """
+        return self.locator()(t)
+
+    def locate_many(self, ts):
+        """Locate each datetime of an iterable, as with locate.
+        :return: list of (k, start, end) or None
+        """
+        locate = self.locator()
+        return [locate(t) for t in ts]
+
+    def locator(self):
+        """Return the function locate applies, with the duration's length
+        and the number of occurrences worked out once.
+        """
+        months = self.duration.monthdelta.months
+        fixed = microseconds(self.duration.timedelta)
+        if months < 0 or fixed < 0:
+            raise ValueError('Cannot locate occurrences of a negative duration %s.' % self.duration)
+        length = months * MONTH_MICROSECONDS + fixed
+        limit = None if self.repeats == self.INFINITE else max(self.repeats, 1)
+        (start, step, delta) = (self.start, self.step, self.duration.timedelta)
+
+        def locate(t):
+            if not length or t < start:
+                return None
+            k = microseconds(t - start) // length
+            if months:
+                k = search(step, t, k)
+            if limit is not None and k >= limit:
+                return None
+            try:
+                if months:
+                    return (k, step(k), step(k + 1))
+                begin = start + timedelta(0, 0, k * length)
+                return (k, begin, begin + delta)
+            except OverflowError:
+                return None
+
+        return locate
 
     def string(self, format=None, component_formats=None):
+        """Render the interval in format, an interval.Format defaulting to
+        START_END, with its datetimes in component_formats, a
+        duration.Format of BASIC, EXTENDED (the default) or WEEK.
+        """
         format_ = format or self.Format.START_END
-        component_formats = component_formats
-        r = 'R/' if self.repeats == self.INFINITE else ('R%d/' % self.repeats if self.repeats else '')     
+        render = datetime_formats.get(component_formats, datetime_extended)
+        r = 'R/' if self.repeats == self.INFINITE else ('R%d/' % self.repeats if self.repeats else '')
         if format_ == self.Format.START_END:
-            s = self.start.strftime('%Y-%m-%dT%H:%M:%S.%f%Z')
-            e = self.end.strftime('%Y-%m-%dT%H:%M:%S.%f%Z')
-            return '%s%s/%s' % (r, s, e)
+            return '%s%s/%s' % (r, render(self.start), render(self.end))
         elif format_ == self.Format.START_DURATION:
-            s = self.start.strftime('%Y-%m-%dT%H:%M:%S.%f%Z')
-            d = self.duration.string()
-            return '%s%s/%s' % (r, s, d)
+            return '%s%s/%s' % (r, render(self.start), self.duration.string())
         elif format_ == self.Format.DURATION_END:
-            d = self.duration.string()
-            e = self.end.strftime('%Y-%m-%dT%H:%M:%S.%f%Z')
-            return '%s%s/%s' % (r, d, e)
+            return '%s%s/%s' % (r, self.duration.string(), render(self.end))
         else:
             return self.duration.string()
 
@@ -80,3 +198,29 @@ class interval(Iterable):
 
     def __hash__(self):
         return hash((self.start, self.end, self.duration, self.repeats))
+
+
+def search(step, t, k):
+    """Return the largest k with step(k) <= t, given step(0) <= t and an
+    estimate k, widening a bracket around the estimate by doubling and
+    then bisecting it.
+    """
+    def before(k):
+        try:
+            return step(k) <= t
+        except OverflowError:
+            return False
+
+    (low, gap) = (k, 1)
+    while low > 0 and not before(low):
+        (low, gap) = (max(low - gap, 0), gap * 2)
+    (high, gap) = (low + 1, 1)
+    while before(high):
+        (low, high, gap) = (high, high + gap * 2, gap * 2)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if before(middle):
+            low = middle
+        else:
+            high = middle
+    return low
@@ -0,0 +1,53 @@
+"""Parse ISO 8601 strings straight into NumPy arrays. Requires numpy,
+available with the ``numpy`` extra.
+"""
+import numpy
+from iso8601utils.helpers.builder import datetime_builder, duration_builder
+from iso8601utils.helpers.epoch import EPOCH, microseconds
+
+
+NAT = numpy.iinfo(numpy.int64).min
+
+
+def nanoseconds(delta):
+    return microseconds(delta) * 1000
+
+
+def datetimes(datetimes):
+    """Parse a sequence of strings representing ISO 8601 datetimes into
+    a datetime64[ns] array normalised to UTC.
+    :param datetimes: A sequence or array of strings representing ISO 8601 datetimes.
+    :return: (numpy.ndarray of datetime64[ns], numpy.ndarray of bool) where
+    the mask is False, and the value NaT, for invalid or out of range datetimes.
+    """
+    values = numpy.empty(len(datetimes), dtype=numpy.int64)
+    mask = numpy.zeros(len(datetimes), dtype=numpy.bool_)
+    for (index, string) in enumerate(datetimes):
+        try:
+            values[index] = nanoseconds(datetime_builder(string) - EPOCH)
+            mask[index] = True
+        except (TypeError, ValueError, OverflowError):
+            values[index] = NAT
+    return (values.view('datetime64[ns]'), mask)
+
+
+def durations(durations):
+    """Parse a sequence of strings representing ISO 8601 durations into
+    a timedelta64[ns] array. Durations with a year or month component have
+    no fixed length and are treated as invalid.
+    :param durations: A sequence or array of strings representing ISO 8601 durations.
+    :return: (numpy.ndarray of timedelta64[ns], numpy.ndarray of bool) where
+    the mask is False, and the value NaT, for invalid or out of range durations.
+    """
+    values = numpy.empty(len(durations), dtype=numpy.int64)
+    mask = numpy.zeros(len(durations), dtype=numpy.bool_)
+    for (index, string) in enumerate(durations):
+        try:
+            value = duration_builder(string)
+            if value is None or value.monthdelta:
+                raise ValueError('Invalid or month based duration.')
+            values[index] = nanoseconds(value.timedelta)
+            mask[index] = True
+        except (TypeError, ValueError, OverflowError):
+            values[index] = NAT
+    return (values.view('timedelta64[ns]'), mask)
@@ -0,0 +1,259 @@
+"""Parse large batches of ISO 8601 strings across a pool of processes.
+Strings are sent to the workers in chunks and each worker sends back
+the values of its chunk packed into an array of 64-bit integers rather
+than pickled objects, which the calling process unpacks in order.
+
+    >>> from iso8601utils import parallel
+    >>> parallel.datetimes(strings, workers=8, errors='none')
+
+Requires concurrent.futures (Python 3.2+).
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as datetime_, timedelta
+from functools import partial
+from itertools import islice
+from iso8601utils import duration as duration_, interval as interval_, parsers
+from iso8601utils.helpers.epoch import epoch_microseconds, microseconds
+from iso8601utils.tz import fixed, timezone, utc
+
+
+CHUNK_SIZE = 10000
+
+
+# Codes packed in place of a timezone offset in minutes.
+INVALID = -2**63
+NAIVE = 2**62
+NOW = 2**62 + 1
+
+
+EPOCH_NAIVE = datetime_(1970, 1, 1)
+
+
+formats = list(duration_.Format)
+
+
+def datetimes(datetimes, workers=None, chunk_size=CHUNK_SIZE, errors='raise', epoch=False,
+        executor=None):
+    """Parse an iterable of strings representing ISO 8601 datetimes.
+    :param datetimes: An iterable of strings representing ISO 8601 datetimes.
+    :param workers: The number of processes, os.cpu_count() if None.
+    :param chunk_size: The number of strings sent to a process at a time.
+    :param errors: 'raise', 'skip' or 'none', as for parsers.batch.
+    :param epoch: Return microseconds since the Unix epoch (UTC) instead
+    of datetime objects.
+    :param executor: A concurrent.futures executor to use instead of
+    starting a process pool for this call.
+    :return: list of datetime.datetime or int
+    :raises: ValueError if errors is 'raise' and a datetime is invalid.
+    """
+    if epoch:
+        return run(pack_epochs, unpack_epochs, datetimes, 'Invalid ISO 8601 datetime',
+            errors, workers, chunk_size, executor)
+    return run(pack_datetimes, partial(unpack_datetimes, bases=epochs()), datetimes,
+        'Invalid ISO 8601 datetime', errors, workers, chunk_size, executor)
+
+
+def durations(durations, workers=None, chunk_size=CHUNK_SIZE, errors='raise', executor=None):
+    """Parse an iterable of strings representing ISO 8601 durations.
+    Parameters as for datetimes.
+    :return: list of iso8601utils.duration
+    :raises: ValueError if errors is 'raise' and a duration is invalid.
+    """
+    return run(pack_durations, unpack_durations, durations, 'Invalid ISO 8601 duration',
+        errors, workers, chunk_size, executor)
+
+
+def intervals(intervals, now=None, designator='/', workers=None, chunk_size=CHUNK_SIZE,
+        errors='raise', executor=None):
+    """Parse an iterable of strings representing ISO 8601 intervals.
+    Parameters as for datetimes.
+    :param now: The end of intervals given only by a duration. Resolved once
+    for the whole batch.
+    :return: list of iso8601utils.interval
+    :raises: ValueError if errors is 'raise' and an interval is invalid.
+    """
+    now = now or datetime_.now()
+    return run(partial(pack_intervals, now=now, designator=designator),
+        partial(unpack_intervals, bases=epochs(now)), intervals, 'Invalid ISO 8601 interval',
+        errors, workers, chunk_size, executor)
+
+
+def run(pack, unpack, strings, error_msg, errors, workers, chunk_size, executor):
+    """Pack the values of chunks of strings in a pool of processes and
+    unpack the values of each chunk in order with unpack, which gives
+    None for invalid strings. Errors are handled as in parsers.batch.
+    """
+    parsers.check_errors(errors)
+
+    chunks = list(split(strings, chunk_size))
+    if executor is not None:
+        packed = executor.map(pack, chunks)
+    elif len(chunks) < 2 or workers == 1:
+        packed = map(pack, chunks)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            packed = list(executor.map(pack, chunks))
+
+    results = []
+    for data in packed:
+        values = array('q')
+        values.frombytes(data)
+        chunk = unpack(values)
+        if errors == 'none':
+            results.extend(chunk)
+            continue
+        for value in chunk:
+            if value is not None:
+                results.append(value)
+            elif errors == 'raise':
+                # Nothing has been skipped, so the index is the count so far.
+                raise ValueError('%s at index %d.' % (error_msg, len(results)))
+    return results
+
+
+def split(strings, size):
+    if size < 1:
+        raise ValueError('chunk_size must be at least 1.')
+    strings = iter(strings)
+    chunk = list(islice(strings, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(strings, size))
+
+
+# Packing runs in the worker processes.
+
+def pack_datetime(values, value, bases, now=None):
+    """Append the wall clock microseconds since 1970-01-01 of a datetime
+    and its timezone: its offset in minutes, NAIVE, or NOW if it is the
+    tzinfo of now, or INVALID twice for None. bases caches 1970-01-01 in
+    each timezone, as subtracting datetimes with the same tzinfo is much
+    cheaper than replacing the tzinfo of each.
+    """
+    if value is None:
+        values.extend((INVALID, INVALID))
+        return
+    tzinfo = value.tzinfo
+    try:
+        (base, code) = bases[tzinfo]
+    except KeyError:
+        if tzinfo is None:
+            code = NAIVE
+        elif tzinfo is utc:
+            code = 0
+        elif now is not None and tzinfo is now.tzinfo:
+            code = NOW
+        elif isinstance(tzinfo, timezone):
+            offset = tzinfo.offset
+            code = (offset.days * 86400 + offset.seconds) // 60
+        else:
+            raise ValueError('Cannot pack timezone %r.' % tzinfo)
+        (base, code) = bases[tzinfo] = (EPOCH_NAIVE.replace(tzinfo=tzinfo), code)
+    values.append(microseconds(value - base))
+    values.append(code)
+
+
+def pack_duration(values, value):
+    """Append the format, months, days and microseconds of the day of
+    a duration, or INVALID four times for None.
+    """
+    if value is None:
+        values.extend((INVALID, INVALID, INVALID, INVALID))
+        return
+    values.extend((formats.index(value.print_format), value._months, value._days,
+        value._microseconds))
+
+
+def pack_datetimes(strings):
+    (values, bases) = (array('q'), {})
+    for string in strings:
+        pack_datetime(values, parsers.try_datetime(string), bases)
+    return values.tobytes()
+
+
+def pack_epochs(strings):
+    values = array('q')
+    for string in strings:
+        value = parsers.try_datetime(string)
+        values.append(INVALID if value is None else epoch_microseconds(value))
+    return values.tobytes()
+
+
+def pack_durations(strings):
+    values = array('q')
+    for string in strings:
+        pack_duration(values, parsers.try_duration(string))
+    return values.tobytes()
+
+
+def pack_intervals(strings, now, designator):
+    (values, bases) = (array('q'), {})
+    for string in strings:
+        value = parsers.try_interval(string, now, designator)
+        if value is None:
+            values.extend((INVALID,) * 9)
+            continue
+        pack_datetime(values, value.start, bases, now)
+        pack_datetime(values, value.end, bases, now)
+        pack_duration(values, value.duration)
+        values.append(-1 if value.repeats == interval_.INFINITE else value.repeats)
+    return values.tobytes()
+
+
+# Unpacking runs in the calling process, a chunk at a time.
+
+class epochs(dict):
+    """1970-01-01 in the timezone of each code, created on first use."""
+    def __init__(self, now=None):
+        self.now = now
+
+    def __missing__(self, code):
+        if code == NAIVE:
+            tzinfo = None
+        elif code == NOW:
+            tzinfo = self.now.tzinfo
+        elif code == 0:
+            tzinfo = utc
+        else:
+            (hours, minutes) = divmod(abs(code), 60)
+            tzinfo = fixed(hours, minutes) if code > 0 else fixed(-hours, -minutes)
+        value = self[code] = EPOCH_NAIVE.replace(tzinfo=tzinfo)
+        return value
+
+
+def unpack_datetimes(values, bases):
+    return [None if code == INVALID else bases[code] + timedelta(0, 0, value)
+        for (value, code) in zip(values[::2], values[1::2])]
+
+
+def unpack_epochs(values):
+    return [None if value == INVALID else value for value in values]
+
+
+def unpack_duration(values, offset):
+    format = values[offset]
+    if format == INVALID:
+        return None
+    return duration_._from_ints(values[offset + 1], values[offset + 2], values[offset + 3],
+        formats[format])
+
+
+def unpack_durations(values):
+    return [unpack_duration(values, offset) for offset in range(0, len(values), 4)]
+
+
+def unpack_intervals(values, bases):
+    results = []
+    for offset in range(0, len(values), 9):
+        if values[offset + 1] == INVALID:
+            results.append(None)
+            continue
+        (start, start_code, end, end_code) = values[offset:offset + 4]
+        repeats = values[offset + 8]
+        value = interval_.__new__(interval_)
+        value.__setstate__((bases[start_code] + timedelta(0, 0, start),
+            bases[end_code] + timedelta(0, 0, end), unpack_duration(values, offset + 4),
+            interval_.INFINITE if repeats == -1 else repeats))
+        results.append(value)
+    return results
@@ -1,7 +1,11 @@
+from collections import Counter, namedtuple
 from datetime import datetime as datetime_, timedelta
 from iso8601utils import interval as interval_
 from iso8601utils.helpers.builder import (duration_builder, time_builder, date_builder,
-    datetime_builder, datetime_builder_partial, repeat_builder)
+    datetime_builder, datetime_builder_partial, repeat_builder, date_shape, contiguous, literal)
+
+
+Result = namedtuple('Result', 'kind value')
 
 
 def time(time):
@@ -11,10 +15,10 @@ def time(time):
     :return: datetime.time
     :raises: ValueError if time is not a valid ISO 8601 time.
     """
-    try:
-        return time_builder(time)[0]
-    except:
+    value = try_time(time)
+    if value is None:
         raise ValueError('Invalid ISO 8601 time.')
+    return value
 
 
 def date(date):
@@ -24,10 +28,10 @@ def date(date):
     :return: datetime.date
     :raises: ValueError if date is not a valid ISO 8601 date.
     """
-    try:
-        return date_builder(date)
-    except:
+    value = try_date(date)
+    if value is None:
         raise ValueError('Invalid ISO 8601 date.')
+    return value
 
 
 def datetime(datetime):
@@ -37,10 +41,10 @@ def datetime(datetime):
     :return: datetime.datetime
     :raises: ValueError if datetime is not a valid ISO 8601 datetime.
     """
-    try:
-        return datetime_builder(datetime)
-    except Exception as e:
+    value = try_datetime(datetime)
+    if value is None:
         raise ValueError('Invalid ISO 8601 datetime.')
+    return value
 
 
 def duration(duration):
@@ -50,76 +54,301 @@ def duration(duration):
     :return: iso8601utils.duration
     :raises: ValueError if duration is not a valid ISO 8601 duration.
     """
-    try:
-        return duration_builder(duration)
-    except:
+    value = try_duration(duration)
+    if value is None:
         raise ValueError('Invalid ISO 8601 duration.')
+    return value
 
 
-def interval(interval, now=datetime_.now(), designator='/'):
+def interval(interval, now=None, designator='/'):
     """Parse a string representing an ISO 8601 interval and return
     an iso8601utils.interval object.
     :param interval: A string representing an ISO 8601 interval.
+    :param now: The end of intervals given only by a duration,
+    datetime.now() if None.
     :return: iso8601utils.interval
     :raises: ValueError if interval is not a valid ISO 8601 interval.
     """
-    error_msg = 'Invalid ISO 8601 interval.'
-    components = interval.split(designator)
+    value = try_interval(interval, now, designator)
+    if value is None:
+        raise ValueError('Invalid ISO 8601 interval.')
+    return value
+
+
+def try_time(time):
+    """Parse a string representing an ISO 8601 time without raising.
+    :param time: A string representing an ISO 8601 time.
+    :return: datetime.time or None if time is not a valid ISO 8601 time.
+    """
+    try:
+        value = time_builder(contiguous(time))
+    except (TypeError, AttributeError):
+        return None
+    return value[0] if value else None
+
+
+def try_date(date):
+    """Parse a string representing an ISO 8601 date without raising.
+    :param date: A string representing an ISO 8601 date.
+    :return: datetime.date or None if date is not a valid ISO 8601 date.
+    """
+    try:
+        return date_builder(contiguous(date))
+    except (TypeError, AttributeError):
+        return None
+
+
+def try_datetime(datetime):
+    """Parse a string representing an ISO 8601 datetime without raising.
+    :param datetime: A string representing an ISO 8601 datetime.
+    :return: datetime.datetime or None if datetime is not a valid ISO 8601 datetime.
+    """
+    try:
+        return datetime_builder(contiguous(datetime))
+    except (TypeError, AttributeError):
+        return None
+
+
+def try_duration(duration):
+    """Parse a string representing an ISO 8601 duration without raising.
+    :param duration: A string representing an ISO 8601 duration.
+    :return: iso8601utils.duration or None if duration is not a valid ISO 8601 duration.
+    """
+    try:
+        return duration_builder(contiguous(duration))
+    except (TypeError, AttributeError):
+        return None
+
+
+def try_interval(interval, now=None, designator='/'):
+    """Parse a string representing an ISO 8601 interval without raising.
+    :param interval: A string representing an ISO 8601 interval.
+    :param now: The end of intervals given only by a duration,
+    datetime.now() if None.
+    :return: iso8601utils.interval or None if interval is not a valid ISO 8601 interval.
+    """
+    try:
+        interval = contiguous(interval)
+        kwargs = interval_kwargs(interval.split(literal(interval, designator)), now)
+    except (TypeError, AttributeError):
+        return None
+    if kwargs is None:
+        return None
+    try:
+        return interval_(**kwargs)
+    except (ValueError, OverflowError):
+        return None
+
+
+def interval_kwargs(components, now):
+    """Return the interval keyword arguments for the components of an
+    interval, or None if they are not valid.
+    """
     length = len(components)
     kwargs = {}
     if length == 3:
-        try:
-            kwargs['repeats'] = repeat_builder(components[0])
-        except:
-            raise ValueError(error_msg)
-        try:
-            kwargs['start'] = datetime_builder_partial(components[1], strict=True)
-        except:
-            try:
-                kwargs['duration'] = duration(components[1])
-            except:
-                raise ValueError(error_msg)
-        try:
-            if 'start' in kwargs:
-                kwargs['end'] = datetime_builder_partial(components[2], timedelta(1), kwargs['start'])
-            else:
-                kwargs['end'] = datetime(components[2])
-        except:
-            try:
-                kwargs['duration'] = duration(components[2])
-            except:
-                raise ValueError(error_msg)
+        kwargs['repeats'] = repeat_builder(components[0])
+        if kwargs['repeats'] is None:
+            return None
+        start = datetime_builder_partial(components[1], strict=True)
+        if start is not None:
+            kwargs['start'] = start
+            end = datetime_builder_partial(components[2], timedelta(1), start)
+        else:
+            kwargs['duration'] = duration_builder(components[1])
+            if kwargs['duration'] is None:
+                return None
+            end = datetime_builder(components[2])
+        if end is not None:
+            kwargs['end'] = end
+        elif 'duration' in kwargs:
+            return None
+        else:
+            kwargs['duration'] = duration_builder(components[2])
+            if kwargs['duration'] is None:
+                return None
     elif length == 2:
-        try:
-            kwargs['repeats'] = repeat_builder(components[0])
-            kwargs['duration'] = duration(components[1])
-            kwargs['end'] = now
-        except:
-            try:
-                kwargs['start'] = datetime_builder_partial(components[0], strict=True)
-                try:
-                    kwargs['end'] = datetime_builder_partial(components[1], timedelta(1), kwargs['start'])
-                except:
-                    try:
-                        kwargs['duration'] = duration(components[1])
-                    except:
-                        raise ValueError(error_msg)
-            except:
-                try:
-                    kwargs['duration'] = duration(components[0])
-                    kwargs['end'] = datetime(components[1])
-                except:
-                    raise ValueError(error_msg)
+        repeats = repeat_builder(components[0])
+        if repeats is not None:
+            kwargs['repeats'] = repeats
+            kwargs['duration'] = duration_builder(components[1])
+            if kwargs['duration'] is None:
+                return None
+            kwargs['end'] = now or datetime_.now()
+        else:
+            start = datetime_builder_partial(components[0], strict=True)
+            if start is not None:
+                kwargs['start'] = start
+                end = datetime_builder_partial(components[1], timedelta(1), start)
+                if end is not None:
+                    kwargs['end'] = end
+                else:
+                    kwargs['duration'] = duration_builder(components[1])
+                    if kwargs['duration'] is None:
+                        return None
+            else:
+                kwargs['duration'] = duration_builder(components[0])
+                kwargs['end'] = datetime_builder(components[1])
+                if kwargs['duration'] is None or kwargs['end'] is None:
+                    return None
     elif length == 1:
-        try:
-            kwargs['duration'] = duration(components[0])
-            kwargs['end'] = now
-        except:
-            raise ValueError(error_msg)
+        kwargs['duration'] = duration_builder(components[0])
+        if kwargs['duration'] is None:
+            return None
+        kwargs['end'] = now or datetime_.now()
     else:
-        raise ValueError(error_msg)
+        return None
+    return kwargs
 
+
+def parse(string, now=None, designator='/'):
+    """Parse a string representing any ISO 8601 time, date, datetime,
+    duration or interval and return its kind along with its value.
+    :param string: A string representing an ISO 8601 value.
+    :param now: As for parsers.interval.
+    :return: iso8601utils.parsers.Result (kind, value) where kind is
+    'time', 'date', 'datetime', 'duration' or 'interval'.
+    :raises: ValueError if string is not a valid ISO 8601 value.
+    """
+    result = try_parse(string, now, designator)
+    if result is None:
+        raise ValueError('Invalid ISO 8601 value.')
+    return result
+
+
+def try_parse(string, now=None, designator='/'):
+    """Parse a string representing any ISO 8601 value without raising.
+    The kind is decided from the string once: a designator makes it an
+    interval, a leading P a duration and a T a datetime. Otherwise it is
+    a date if its shape is that of a date, as in 2016 or 2016-W43, and
+    a time if not.
+    :param string: A string representing an ISO 8601 value.
+    :param now: As for parsers.interval.
+    :return: iso8601utils.parsers.Result or None if string is not valid.
+    """
     try:
-        return interval_(**kwargs)
-    except:
-        raise ValueError(error_msg) 
+        string = contiguous(string)
+        if literal(string, designator) in string:
+            kind = 'interval'
+            value = try_interval(string, now, designator)
+        elif string[:1] in ('P', 'p', b'P', b'p'):
+            kind = 'duration'
+            value = duration_builder(string)
+        elif literal(string, 'T') in string:
+            kind = 'datetime'
+            value = datetime_builder(string)
+        else:
+            kind = 'date'
+            value = date_builder(string) if date_shape(string) else None
+            if value is None:
+                kind = 'time'
+                value = time_builder(string)
+                value = value[0] if value else None
+    except (TypeError, AttributeError):
+        return None
+    return None if value is None else Result(kind, value)
+
+
+def parse_many(strings, now=None, designator='/'):
+    """Parse an iterable of strings representing ISO 8601 values of
+    any kind, e.g. to profile a column of mixed values.
+    :param strings: An iterable of strings representing ISO 8601 values.
+    :param now: As for parsers.interval. Resolved once for the whole batch.
+    :return: (list, collections.Counter) of the Result, or None, of each
+    string and the number of strings of each kind, None counting the
+    invalid ones.
+    """
+    now = now or datetime_.now()
+    results = [try_parse(string, now, designator) for string in strings]
+    counts = Counter(result.kind if result else None for result in results)
+    return (results, counts)
+
+
+def times(times, errors='raise', lazy=False):
+    """Parse an iterable of strings representing ISO 8601 times.
+    :param times: An iterable of strings representing ISO 8601 times.
+    :param errors: 'raise', 'skip' or 'none' (see batch).
+    :param lazy: Return a generator instead of a list.
+    :return: list or generator of datetime.time
+    :raises: ValueError if errors is 'raise' and a time is invalid.
+    """
+    return batch(times, try_time, 'Invalid ISO 8601 time', errors, lazy)
+
+
+def dates(dates, errors='raise', lazy=False):
+    """Parse an iterable of strings representing ISO 8601 dates.
+    :param dates: An iterable of strings representing ISO 8601 dates.
+    :param errors: 'raise', 'skip' or 'none' (see batch).
+    :param lazy: Return a generator instead of a list.
+    :return: list or generator of datetime.date
+    :raises: ValueError if errors is 'raise' and a date is invalid.
+    """
+    return batch(dates, try_date, 'Invalid ISO 8601 date', errors, lazy)
+
+
+def datetimes(datetimes, errors='raise', lazy=False):
+    """Parse an iterable of strings representing ISO 8601 datetimes.
+    :param datetimes: An iterable of strings representing ISO 8601 datetimes.
+    :param errors: 'raise', 'skip' or 'none' (see batch).
+    :param lazy: Return a generator instead of a list.
+    :return: list or generator of datetime.datetime
+    :raises: ValueError if errors is 'raise' and a datetime is invalid.
+    """
+    return batch(datetimes, try_datetime, 'Invalid ISO 8601 datetime', errors, lazy)
+
+
+def durations(durations, errors='raise', lazy=False):
+    """Parse an iterable of strings representing ISO 8601 durations.
+    :param durations: An iterable of strings representing ISO 8601 durations.
+    :param errors: 'raise', 'skip' or 'none' (see batch).
+    :param lazy: Return a generator instead of a list.
+    :return: list or generator of iso8601utils.duration
+    :raises: ValueError if errors is 'raise' and a duration is invalid.
+    """
+    return batch(durations, try_duration, 'Invalid ISO 8601 duration', errors, lazy)
+
+
+def intervals(intervals, now=None, designator='/', errors='raise', lazy=False):
+    """Parse an iterable of strings representing ISO 8601 intervals.
+    :param intervals: An iterable of strings representing ISO 8601 intervals.
+    :param now: The end of intervals given only by a duration. Resolved once
+    for the whole batch.
+    :param errors: 'raise', 'skip' or 'none' (see batch).
+    :param lazy: Return a generator instead of a list.
+    :return: list or generator of iso8601utils.interval
+    :raises: ValueError if errors is 'raise' and an interval is invalid.
+    """
+    now = now or datetime_.now()
+    return batch(intervals, lambda value: try_interval(value, now, designator),
+        'Invalid ISO 8601 interval', errors, lazy)
+
+
+def check_errors(errors, policies=('raise', 'skip', 'none')):
+    """Check that errors is one of the error policies of the batch parsers.
+    :raises: ValueError if it is not.
+    """
+    if errors not in policies:
+        quoted = ['\'%s\'' % policy for policy in policies]
+        raise ValueError('errors must be one of %s or %s.' % (', '.join(quoted[:-1]), quoted[-1]))
+
+
+def batch(strings, build, error_msg, errors='raise', lazy=False):
+    """Apply build to each string. When it returns None, errors='raise' raises a
+    ValueError naming the index of the offending string, errors='skip'
+    drops it and errors='none' puts None in its place so that results
+    keep the indices of strings.
+    """
+    check_errors(errors)
+
+    def generate():
+        for (index, string) in enumerate(strings):
+            value = build(string)
+            if value is None:
+                if errors == 'raise':
+                    raise ValueError('%s at index %d.' % (error_msg, index))
+                elif errors == 'skip':
+                    continue
+            yield value
+
+    results = generate()
+    return results if lazy else list(results)
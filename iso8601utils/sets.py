@@ -0,0 +1,170 @@
+"""Sets of datetimes made of intervals: union, intersection, difference
+and complement. A set keeps its datetimes as a sorted tuple of disjoint
+(start, end) pairs, so set operations sweep both sets once and
+membership is a binary search.
+
+    >>> from iso8601utils.sets import IntervalSet
+    >>> IntervalSet(['2020-01-01T00:00Z/PT2H']) - IntervalSet(['2020-01-01T00:30Z/PT30M'])
+    iso8601utils.sets.IntervalSet(2020-01-01T00:00:00.000000Z/2020-01-01T00:30:00.000000Z, 2020-01-01T01:00:00.000000Z/2020-01-01T02:00:00.000000Z)
+"""
+from bisect import bisect_right
+from heapq import merge
+from iso8601utils import duration as duration_, interval as interval_
+from iso8601utils import parsers
+from iso8601utils.helpers.epoch import microseconds
+
+
+def spans(values):
+    """Generate the (start, end) pair of each occurrence of each interval,
+    parsing strings with parsers.interval.
+    :raises: ValueError for intervals recurring indefinitely.
+    """
+    for value in values:
+        if not isinstance(value, interval_):
+            value = parsers.interval(value)
+        if value.repeats == interval_.INFINITE:
+            raise ValueError('Cannot add an indefinitely recurring interval %s.' % value)
+        if value.repeats:
+            for span in value.occurrences():
+                yield span
+        else:
+            yield (value.start, value.end)
+
+
+def coalesce(spans):
+    """Merge sorted (start, end) pairs into disjoint pairs, joining pairs
+    that overlap or touch and dropping empty ones.
+    :return: tuple of (start, end) pairs
+    """
+    results = []
+    for (start, end) in spans:
+        if not start < end:
+            continue
+        if results and start <= results[-1][1]:
+            if end > results[-1][1]:
+                results[-1] = (results[-1][0], end)
+        else:
+            results.append((start, end))
+    return tuple(results)
+
+
+def length(start, end):
+    return duration_._from_ints(0, 0, microseconds(end - start))
+
+
+class IntervalSet(object):
+    """An immutable set of datetimes stored as sorted, disjoint half-open
+    [start, end) spans, built from interval objects or strings. Intervals
+    recurring n times add each occurrence and intervals ending before they
+    start add nothing. Building a set sorts its spans in O(n log n), and
+    union, intersection and difference sweep both sets once in O(n + m).
+    """
+    def __init__(self, intervals=()):
+        self.spans = coalesce(sorted(spans(intervals)))
+
+    @classmethod
+    def from_spans(cls, spans):
+        """Create a set from sorted, disjoint (start, end) pairs."""
+        value = cls.__new__(cls)
+        value.spans = tuple(spans)
+        return value
+
+    def union(self, other):
+        """:return: IntervalSet of the datetimes in either set."""
+        return IntervalSet.from_spans(coalesce(merge(self.spans, coerce(other).spans)))
+
+    def intersection(self, other):
+        """:return: IntervalSet of the datetimes in both sets."""
+        (a, b) = (self.spans, coerce(other).spans)
+        (i, j) = (0, 0)
+        results = []
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start < end:
+                results.append((start, end))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet.from_spans(results)
+
+    def difference(self, other):
+        """:return: IntervalSet of the datetimes in this set but not other."""
+        b = coerce(other).spans
+        j = 0
+        results = []
+        for (start, end) in self.spans:
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < end:
+                if b[k][0] > start:
+                    results.append((start, b[k][0]))
+                start = max(start, b[k][1])
+                k += 1
+            if start < end:
+                results.append((start, end))
+        return IntervalSet.from_spans(results)
+
+    def complement(self, bounds):
+        """Return the datetimes within bounds missing from this set.
+        :param bounds: An interval, or a string parsed with parsers.interval.
+        :return: IntervalSet
+        """
+        return IntervalSet([bounds]).difference(self)
+
+    def total(self):
+        """Return the length of the set.
+        :return: iso8601utils.duration without a month component.
+        """
+        return duration_._from_ints(0, 0, sum(microseconds(end - start) for (start, end) in self.spans))
+
+    def intervals(self):
+        """Return the spans of the set as interval objects, in order.
+        :return: list of iso8601utils.interval
+        """
+        return [interval_(start=start, duration=length(start, end)) for (start, end) in self.spans]
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __iter__(self):
+        return iter(self.intervals())
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __bool__(self):
+        return bool(self.spans)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, t):
+        """Whether the datetime t is in the set, by binary search."""
+        index = bisect_right(self.spans, (t,)) - 1
+        if index + 1 < len(self.spans) and self.spans[index + 1][0] == t:
+            return True
+        return index >= 0 and t < self.spans[index][1]
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.spans == other.spans
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.spans)
+
+    def __repr__(self):
+        return 'iso8601utils.sets.IntervalSet(%s)' % ', '.join(i.string() for i in self.intervals())
+
+
+def coerce(value):
+    return value if isinstance(value, IntervalSet) else IntervalSet(value)
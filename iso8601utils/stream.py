@@ -0,0 +1,106 @@
+"""Extract ISO 8601 datetimes from large line oriented files (logs, CSV)
+without reading them into memory. The file is memory-mapped and only the
+bytes of the timestamp field of each line are copied out and handed to
+the same builder as parsers.datetime.
+
+    >>> from iso8601utils import stream
+    >>> for values in stream.chunks('access.log', delimiter=b' ', epoch=True):
+    ...     process(values)
+"""
+import mmap
+from iso8601utils.helpers.builder import datetime_builder
+from iso8601utils.helpers.epoch import epoch_microseconds
+from iso8601utils.parsers import check_errors
+
+
+def chunks(path, column=0, offset=0, delimiter=b',', epoch=False, skip=0,
+        errors='none', chunk_size=65536):
+    """Generate lists of up to chunk_size datetimes parsed from one field
+    of each line of a file.
+    :param path: The path of the file.
+    :param column: The index of the field holding the datetime, with
+    fields separated by delimiter.
+    :param offset: The byte offset of the datetime within its field.
+    :param delimiter: The bytes ending each field.
+    :param epoch: Yield microseconds since the Unix epoch (UTC) instead
+    of datetime objects.
+    :param skip: The number of leading lines to ignore, e.g. a CSV header.
+    :param errors: 'raise', 'skip' or 'none', as for parsers.batch.
+    :param chunk_size: The maximum number of values per list.
+    :return: generator of lists of datetime.datetime or int
+    :raises: ValueError if errors is 'raise' and a line has no valid datetime.
+    """
+    check_errors(errors)
+
+    with open(path, 'rb') as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file
+            return
+        try:
+            size = len(buffer)
+            step = len(delimiter)
+            position = 0
+            line = 0
+            values = []
+            while position < size:
+                end_of_line = buffer.find(b'\n', position)
+                if end_of_line < 0:
+                    end_of_line = size
+                line_start, position = position, end_of_line + 1
+                line += 1
+                if line <= skip:
+                    continue
+                if end_of_line > line_start and buffer[end_of_line - 1:end_of_line] == b'\r':
+                    end_of_line -= 1
+
+                value = None
+                start = field(buffer, line_start, end_of_line, column, delimiter, step)
+                if start >= 0:
+                    end = buffer.find(delimiter, start, end_of_line)
+                    if end < 0:
+                        end = end_of_line
+                    try:
+                        value = datetime_builder(buffer[start + offset:end])
+                    except ValueError:
+                        value = None
+                    if epoch and value is not None:
+                        value = epoch_microseconds(value)
+
+                if value is None:
+                    if errors == 'raise':
+                        raise ValueError('Invalid ISO 8601 datetime on line %d.' % line)
+                    elif errors == 'skip':
+                        continue
+                values.append(value)
+                if len(values) == chunk_size:
+                    yield values
+                    values = []
+            if values:
+                yield values
+        finally:
+            buffer.close()
+
+
+def field(buffer, start, end, column, delimiter, step):
+    """Return the position of field column within buffer[start:end],
+    or -1 if the line has fewer fields.
+    """
+    for _ in range(column):
+        start = buffer.find(delimiter, start, end)
+        if start < 0:
+            return -1
+        start += step
+    return start
+
+
+def scan(path, **kwargs):
+    """Generate the datetimes of chunks one at a time.
+    :param path: The path of the file.
+    :param kwargs: As for chunks.
+    :return: generator of datetime.datetime or int
+    """
+    for values in chunks(path, **kwargs):
+        for value in values:
+            yield value
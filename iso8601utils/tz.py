@@ -1,12 +1,20 @@
+# -*- coding: UTF-8 -*-
 from collections import Iterable
-from copy import deepcopy
 from datetime import timedelta, tzinfo
 
 
 class timezone(tzinfo, Iterable):
     def __init__(self, hours=0, minutes=0, name=None):
-        self.offset = timedelta(hours=hours, minutes=minutes)
-        self.name = name or self.string()
+        self._offset = timedelta(hours=hours, minutes=minutes)
+        self._name = name or offset_name(self._offset)
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @property
+    def name(self):
+        return self._name
 
     def __neg__(self):
         (hours, minutes) = tuple(self)
@@ -52,4 +60,30 @@ class timezone(tzinfo, Iterable):
         return self.name
 
 
-utc = timezone(hours=0, minutes=0, name='Z')
\ No newline at end of file
+def offset_name(offset):
+    seconds = offset.days * 86400 + offset.seconds
+    sign = '-' if seconds < 0 else '+'
+    (hours, minutes) = divmod(abs(seconds) // 60, 60)
+    return '%s%02d:%02d' % (sign, hours, minutes)
+
+
+utc = timezone(hours=0, minutes=0, name='Z')
+
+
+# Shared timezones keyed on signed (hours, minutes) as in
+# timezone(hours, minutes), created on first use of each offset.
+offsets = {}
+
+
+def fixed(hours=0, minutes=0):
+    """Return the shared, immutable timezone for an offset of
+    hours and minutes, both negative for offsets west of UTC.
+    :raises: ValueError if the offset is not a valid ±hh:mm offset, from
+    -23:59 to +23:59, as tzinfo offsets must be less than a day.
+    """
+    try:
+        return offsets[(hours, minutes)]
+    except KeyError:
+        if not (-23 <= hours <= 23 and -59 <= minutes <= 59 and hours * minutes >= 0):
+            raise ValueError('Invalid timezone offset.')
+        return offsets.setdefault((hours, minutes), timezone(hours, minutes))
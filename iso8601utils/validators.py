@@ -1,5 +1,6 @@
 from iso8601utils.helpers import regex as r
-from iso8601utils.helpers.builder import time_builder
+from iso8601utils.helpers.builder import (date_shape, date_shape_partial, duration_shape,
+    dates, dates_strict, dates_partial, durations, contiguous, literal)
 
 
 def runner(string, regexes):
@@ -9,16 +10,42 @@ def runner(string, regexes):
     return False
 
 
+def recognise(string, shape, regexes):
+    """Match string against the only regex of regexes its shape allows."""
+    entry = regexes.get(shape(string))
+    if entry is None:
+        return False
+    (regex, regex_bytes, _) = entry
+    return (regex if isinstance(string, str) else regex_bytes).match(string) is not None
+
+
 def time(time):
     """Return a time object representing the ISO 8601 time.
     :param time: The ISO 8601 time.
     :return: boolean
     """
     try:
-        time_builder(time)
-        return True
-    except:
+        time = contiguous(time)
+        match = (r.time if isinstance(time, str) else r.time_bytes).match(time)
+    except (TypeError, AttributeError):
+        return False
+    if match is None:
+        return False
+    try:
+        (hour, minute, second, millisecond, offset_hour, offset_minute) = [int(v or 0)
+            for v in match.group('hour', 'minute', 'second', 'millisecond',
+                'offset_hour', 'offset_minute')]
+    except ValueError:
+        # The [0,1] classes of the hour patterns also admit a comma.
         return False
+    # The same checks as building a datetime.time and its timezone.
+    if match.group('sign') and not offset_hour and not offset_minute:
+        return False
+    if millisecond > 999:
+        return False
+    if hour == 24 and (minute or second or millisecond):
+        return False
+    return True
 
 
 def date(date):
@@ -26,7 +53,10 @@ def date(date):
     :param date: The ISO 8601 date.
     :return: boolean
     """
-    return runner(date, r.dates)
+    try:
+        return recognise(contiguous(date), date_shape, dates)
+    except (TypeError, AttributeError):
+        return False
 
 
 def datetime(datetime):
@@ -35,39 +65,32 @@ def datetime(datetime):
     :return: boolean
     """
     try:
-        [date_str, time_str] = datetime.split('T')
-        return date(date_str) and time(time_str)
-    except:
+        datetime = contiguous(datetime)
+        components = datetime.split(literal(datetime, 'T'))
+    except (TypeError, AttributeError):
         return False
+    return len(components) == 2 and date(components[0]) and time(components[1])
 
 
 def _datetime_strict(datetime):
-    try:
-        components = datetime.split('T')
-        length = len(components)
-        if length == 2:
-            [date_str, time_str] = components
-            return runner(date_str, r.dates_strict) and time(time_str)
-        elif length == 1:
-            return runner(components[0], r.dates_strict) or time(components[0])
-        else:
-            return False
-    except:
+    components = datetime.split(literal(datetime, 'T'))
+    length = len(components)
+    if length == 2:
+        return recognise(components[0], date_shape, dates_strict) and time(components[1])
+    elif length == 1:
+        return recognise(datetime, date_shape, dates_strict) or time(datetime)
+    else:
         return False
 
 
 def _datetime_partial(datetime):
-    try:
-        components = datetime.split('T')
-        length = len(components)
-        if length == 2:
-            [date_str, time_str] = components
-            return runner(date_str, r.dates_partial) and time(time_str)
-        elif length == 1:
-            return runner(components[0], r.dates_partial) or time(components[0])
-        else:
-            return False
-    except:
+    components = datetime.split(literal(datetime, 'T'))
+    length = len(components)
+    if length == 2:
+        return recognise(components[0], date_shape_partial, dates_partial) and time(components[1])
+    elif length == 1:
+        return recognise(datetime, date_shape_partial, dates_partial) or time(datetime)
+    else:
         return False
 
 
@@ -76,7 +99,11 @@ def interval(interval, designator='/'):
     :param interval: The ISO 8601 interval.
     :return: boolean
     """
-    components = interval.split(designator)
+    try:
+        interval = contiguous(interval)
+        components = interval.split(literal(interval, designator))
+    except (TypeError, AttributeError):
+        return False
     length = len(components)
     if length == 3:
         return validate_repeat(components[0]) and validate_interval(components[1], components[2])
@@ -92,20 +119,24 @@ def duration(duration):
     :param duration: The ISO 8601 duration.
     :return: boolean
     """
-    return runner(duration, r.durations)
+    try:
+        return recognise(contiguous(duration), duration_shape, durations)
+    except (TypeError, AttributeError):
+        return False
 
 
 # Helpers
 def validate_repeat(repeat):
-    return r.repeat.match(repeat) != None
+    return (r.repeat if isinstance(repeat, str) else r.repeat_bytes).match(repeat) != None
 
 
 def validate_interval(start, end):
-    if ((datetime(start) and datetime(end)) or 
-        (datetime(start) and duration(end)) or
-        (duration(start) and datetime(end)) or
-        (_datetime_strict(start) and _datetime_partial(end))):
-        return True
-    else:
-        return False
+    # Classify each component once: a start that is a datetime is never
+    # a duration and vice versa.
+    if datetime(start):
+        if datetime(end) or duration(end):
+            return True
+    elif duration(start):
+        return datetime(end)
+    return _datetime_strict(start) and _datetime_partial(end)
 
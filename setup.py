@@ -80,5 +80,7 @@ setup(
     # $ pip install -e .[dev,test]
     extras_require={
         'test': ['coverage', 'codecov', 'pytest', 'mock'],
+        'numpy': ['numpy'],
+        'benchmark': ['pytest', 'pytest-benchmark'],
     },
 )
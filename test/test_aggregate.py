@@ -0,0 +1,39 @@
+import pytest
+
+
+from iso8601utils import aggregate, duration, parsers
+
+
+def test_sum():
+    values = [duration(hours=1), 'PT30M', b'P1M', parsers.duration('P1DT0.5S')]
+    assert aggregate.sum(values) == duration(months=1, days=1, hours=1, minutes=30, seconds=0.5)
+    assert aggregate.sum(values) == sum([parsers.duration(v) if not isinstance(v, duration) else v
+        for v in values], duration())
+    assert aggregate.sum([]) == duration()
+    assert aggregate.sum(['PT1H'] * 10000).string() == 'P416DT16H'
+    assert aggregate.sum(['PT1H', 'invalid', 'PT1H'], errors='skip') == duration(hours=2)
+
+    with pytest.raises(ValueError) as e:
+        aggregate.sum(['PT1H', 'invalid'])
+    assert 'index 1' in str(e.value)
+
+    with pytest.raises(ValueError):
+        aggregate.sum([], errors='none')
+
+
+def test_mean():
+    assert aggregate.mean(['PT1H', 'PT2H', 'P1M']) == duration(minutes=60)
+    assert aggregate.mean(['P1M', 'P2M', 'PT1S']) == duration(months=1, seconds=1.0 / 3)
+    assert aggregate.mean([-duration(seconds=1), duration()]).timedelta.total_seconds() == -0.5
+
+    with pytest.raises(ValueError):
+        aggregate.mean([])
+
+    with pytest.raises(ValueError):
+        aggregate.mean(['invalid'], errors='skip')
+
+
+def test_sum_by():
+    totals = aggregate.sum_by([('a', 'PT1H'), ('b', duration(days=1)), ('a', 'P1M'), ('b', 'invalid')],
+        errors='skip')
+    assert totals == {'a': duration(months=1, hours=1), 'b': duration(days=1)}
@@ -0,0 +1,71 @@
+import sys
+from datetime import datetime
+
+import pytest
+
+if sys.version_info < (3, 6):
+    pytest.skip('Async generators need Python 3.6', allow_module_level=True)
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from iso8601utils import aio, parsers
+from iso8601utils.tz import utc
+
+
+def collect(generator, data, size):
+    """Feed data to a StreamReader and run generator(aio.chunks(reader,
+    size)) to the end, returning what it yields.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        reader = asyncio.StreamReader(loop=loop)
+        reader.feed_data(data)
+        reader.feed_eof()
+        iterator = generator(aio.chunks(reader, size))
+        results = []
+        while True:
+            try:
+                results.append(loop.run_until_complete(iterator.__anext__()))
+            except StopAsyncIteration:
+                return results
+    finally:
+        loop.close()
+
+
+data = b'2007-08-09T12:30-02:00\r\ninvalid\n\n2016-08-01T23:10:59.111Z'
+
+
+def test_lines():
+    for size in (1, 5, 100):
+        assert sum(collect(aio.lines, data, size), []) == [b'2007-08-09T12:30-02:00', b'invalid', b'',
+            b'2016-08-01T23:10:59.111Z']
+    assert collect(aio.lines, data, 100) == [[b'2007-08-09T12:30-02:00', b'invalid', b''],
+        [b'2016-08-01T23:10:59.111Z']]
+    assert collect(aio.lines, b'', 100) == []
+
+
+def test_batches():
+    expected = [parsers.datetime('2007-08-09T12:30-02:00'), None, None,
+        datetime(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)]
+    assert collect(lambda chunks: aio.scan(chunks), data, 3) == expected
+    assert collect(lambda chunks: aio.batches(chunks, batch_size=2), data, 100) == [expected[:2],
+        expected[2:3], expected[3:]]
+    assert collect(lambda chunks: aio.scan(chunks, errors='skip'), data, 7) == [expected[0], expected[3]]
+
+    with ThreadPoolExecutor(1) as executor:
+        assert collect(lambda chunks: aio.scan(chunks, executor=executor, offload=1), data, 5) == expected
+
+    with pytest.raises(ValueError) as e:
+        collect(lambda chunks: aio.scan(chunks, errors='raise'), data, 5)
+    assert 'line 2' in str(e.value)
+
+
+def test_kinds():
+    now = datetime(2016, 1, 1)
+    values = collect(lambda chunks: aio.scan(chunks, kind='interval', now=now),
+        b'2007-03-01T13:00:00Z/P1Y2M10DT2H30M\nP1D\n', 4)
+    assert values == [parsers.interval('2007-03-01T13:00:00Z/P1Y2M10DT2H30M'), parsers.interval('P1D', now)]
+    assert collect(lambda chunks: aio.scan(chunks, kind='duration'), b'PT36H\n', 2)[0].string() == 'P1DT12H'
+
+    with pytest.raises(ValueError):
+        collect(lambda chunks: aio.scan(chunks, kind='week'), data, 5)
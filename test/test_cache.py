@@ -0,0 +1,90 @@
+import pytest
+
+
+from datetime import datetime
+from iso8601utils import cache, duration, interval
+from iso8601utils import parsers as parsers_
+from iso8601utils.tz import utc
+
+
+def test_lru():
+    calls = []
+    f = cache.lru(lambda s: calls.append(s) or s.upper(), maxsize=2)
+    assert f('a') == 'A'
+    assert f('b') == 'B'
+    assert f('a') == 'A'
+    assert f('c') == 'C'
+    assert f('b') == 'B'
+    assert calls == ['a', 'b', 'c', 'b']
+    assert f.info() == cache.CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+    f.clear()
+    assert f.info() == cache.CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    with pytest.raises(ValueError):
+        cache.lru(len, maxsize=0)
+
+
+def test_parsers():
+    parsers = cache.parsers(maxsize=16)
+    assert parsers.datetime('2007-08-09T12:30Z') == datetime(2007, 8, 9, 12, 30, tzinfo=utc)
+    assert parsers.datetime('2007-08-09T12:30Z') == datetime(2007, 8, 9, 12, 30, tzinfo=utc)
+    assert parsers.info()['datetime'] == cache.CacheInfo(hits=1, misses=1, maxsize=16, currsize=1)
+
+    with pytest.raises(ValueError):
+        parsers.duration('asdf')
+    assert parsers.info()['duration'].currsize == 0
+
+    assert parsers.duration('P6W') is parsers.duration('P6W')
+    assert parsers.duration('P6W').string() == 'P6W'
+
+    with pytest.raises(AttributeError):
+        parsers.interval('2007-11-13/15').end = None
+    assert parsers.interval('2007-11-13/15') == interval(start=datetime(2007, 11, 13, tzinfo=utc),
+        end=datetime(2007, 11, 16, tzinfo=utc))
+
+    now = datetime(2016, 1, 1)
+    assert parsers.interval('P7Y', now=now) == interval(end=now, duration=duration(years=7))
+
+    parsers.clear()
+    assert parsers.info()['interval'] == cache.CacheInfo(hits=0, misses=0, maxsize=16, currsize=0)
+
+
+def test_validators():
+    validators = cache.validators()
+    assert validators.date('1981-095') == True
+    assert validators.date('198195') == False
+    assert validators.date('198195') == False
+    assert validators.info()['date'] == cache.CacheInfo(hits=1, misses=2, maxsize=1024, currsize=2)
+
+
+def test_now(monkeypatch):
+    clock = [datetime(2016, 1, 1)]
+
+    class moving(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[0]
+
+    monkeypatch.setattr(parsers_, 'datetime_', moving)
+    parsers = cache.parsers()
+    for string in ('PT5M', 'R2/PT5M'):
+        first = parsers.interval(string)
+        clock[0] = datetime(2016, 1, 2)
+        second = parsers.interval(string)
+        assert (first.end, second.end) == (datetime(2016, 1, 1), datetime(2016, 1, 2))
+        clock[0] = datetime(2016, 1, 1)
+    assert parsers.info()['interval'].currsize == 0
+
+    parsers.interval('2007-11-13/P1D')
+    assert parsers.interval('2007-11-13/P1D') is parsers.interval('2007-11-13/P1D')
+    assert parsers.info()['interval'].currsize == 1
+
+
+def test_bytes():
+    parsers = cache.parsers()
+    for string in (b'P6W', bytearray(b'P6W'), memoryview(b'P6W')):
+        assert parsers.duration(string).string() == 'P6W'
+    assert parsers.info()['duration'] == cache.CacheInfo(hits=2, misses=1, maxsize=1024, currsize=1)
+    assert cache.validators().date(bytearray(b'1981-095')) == True
+    assert cache.validators().date([]) == False
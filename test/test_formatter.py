@@ -0,0 +1,68 @@
+import pytest
+
+
+from datetime import datetime, timedelta
+from monthdelta import MonthDelta as monthdelta
+from iso8601utils import formatter, duration, interval
+from iso8601utils.tz import fixed, utc
+
+
+def test_datetime():
+    d = datetime(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)
+    assert formatter.datetime(d) == '2016-08-01T23:10:59.111000Z'
+    assert formatter.datetime(d) == d.strftime('%Y-%m-%dT%H:%M:%S.%f%Z')
+    assert formatter.datetime(d, duration.Format.BASIC) == '20160801T231059.111000Z'
+    assert formatter.datetime(d, duration.Format.WEEK) == '2016-W31-1T23:10:59.111000Z'
+
+    d = datetime(9, 1, 1, 0, 0, 0, 5, tzinfo=fixed(-5, -30))
+    assert formatter.datetime(d) == '0009-01-01T00:00:00.000005-05:30'
+    assert formatter.datetime(d, duration.Format.BASIC) == '00090101T000000.000005-0530'
+    assert formatter.datetime(datetime(2008, 12, 29)) == '2008-12-29T00:00:00.000000'
+    assert formatter.datetime(datetime(2008, 12, 29), duration.Format.WEEK) == '2009-W01-1T00:00:00.000000'
+
+    with pytest.raises(ValueError):
+        formatter.datetime(d, duration.Format.DURATION)
+
+
+def test_duration():
+    d = duration(timedelta=timedelta(days=4, hours=12, minutes=30, seconds=5, microseconds=250000),
+        monthdelta=monthdelta(42))
+    assert formatter.duration(d) == 'P3Y6M4DT12H30M5.25S'
+    assert formatter.duration(d, duration.Format.BASIC) == 'P00030604T123005.25'
+    assert formatter.duration(d, duration.Format.EXTENDED) == 'P0003-06-04T12:30:05.25'
+    assert formatter.duration(duration(months=6)) == 'P6MT'
+    assert formatter.duration(-duration(months=13)) == 'P-1Y-1MT'
+    assert formatter.duration(duration(seconds=0.000001)) == 'PT.000001S'
+    assert formatter.duration(duration(weeks=6)) == 'P6W'
+
+
+def test_interval():
+    i = interval(start=datetime(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc),
+        duration=duration(days=1, minutes=1), repeats=2)
+    assert formatter.interval(i) == 'R2/2016-08-01T23:10:59.111000Z/2016-08-02T23:11:59.111000Z'
+    assert formatter.interval(i, interval.Format.START_DURATION,
+        duration.Format.BASIC) == 'R2/20160801T231059.111000Z/P1DT1M'
+    assert formatter.interval(i, interval.Format.DURATION_END) == 'R2/P1DT1M/2016-08-02T23:11:59.111000Z'
+    assert formatter.interval(i) == i.string()
+
+
+def test_format_many():
+    d = datetime(2016, 8, 1, tzinfo=utc)
+    i = interval(start=d, duration=duration(hours=1))
+    values = [d, d, duration(hours=1), i]
+    assert formatter.format_many(values) == ['2016-08-01T00:00:00.000000Z'] * 2 + \
+        ['PT1H', '2016-08-01T00:00:00.000000Z/2016-08-01T01:00:00.000000Z']
+    assert formatter.format_many(values, duration.Format.BASIC) == ['20160801T000000.000000Z'] * 2 + \
+        ['P00000000T010000', '2016-08-01T00:00:00.000000Z/2016-08-01T01:00:00.000000Z']
+    assert formatter.format_many(values, interval.Format.START_DURATION)[3] == '2016-08-01T00:00:00.000000Z/PT1H'
+    assert formatter.format_many([d, duration(days=1)], duration.Format.DURATION) == [
+        '2016-08-01T00:00:00.000000Z', 'P1DT']
+    assert formatter.format_many([d, duration(weeks=1)], duration.Format.WEEK) == ['2016-W31-1T00:00:00.000000Z',
+        'P1W']
+    assert formatter.format_many(iter([])) == []
+
+    with pytest.raises(ValueError):
+        formatter.renderer(datetime, duration.Format.DURATION)
+
+    with pytest.raises(ValueError):
+        formatter.format_many([d, 'P1D'])
@@ -0,0 +1,60 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+# The import time budget, in microseconds, of the package's own modules
+# when a process imports the parsers and validators: the sum of the self
+# column of python -X importtime, best of a few runs. Standard library
+# modules such as re and datetime are not counted. Wall-clock time varies
+# with the machine, so this is only checked when IMPORTTIME is set, as in
+# tox -e importtime.
+IMPORT_BUDGET = 20000
+
+
+# The modules importing the parsers and validators loads.
+MODULES = ['iso8601utils', 'iso8601utils.duration', 'iso8601utils.helpers',
+    'iso8601utils.helpers.builder', 'iso8601utils.helpers.epoch', 'iso8601utils.helpers.format',
+    'iso8601utils.helpers.match', 'iso8601utils.helpers.regex', 'iso8601utils.interval',
+    'iso8601utils.parsers', 'iso8601utils.tz', 'iso8601utils.validators']
+
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code, *options):
+    return subprocess.check_output([sys.executable] + list(options) + ['-c', code],
+        stderr=subprocess.STDOUT, universal_newlines=True, cwd=root)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='-X importtime needs Python 3.7')
+@pytest.mark.skipif(not os.environ.get('IMPORTTIME'), reason='Set IMPORTTIME to check the import time budget')
+def test_import_time():
+    def measure():
+        output = run('import iso8601utils.parsers, iso8601utils.validators', '-X', 'importtime')
+        return sum(int(m.group(1)) for m in
+            re.finditer(r'import time:\s+(\d+) \|\s+\d+ \|\s*iso8601utils\b', output))
+
+    assert min(measure() for _ in range(5)) < IMPORT_BUDGET
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Lazy submodules need Python 3.7')
+def test_lazy():
+    output = run('import sys, iso8601utils.validators\n'
+        'from iso8601utils.helpers import regex\n'
+        'print(sorted(k for k, v in vars(regex).items() if isinstance(v, regex.lazy) and "match" in vars(v)))\n'
+        'print(sorted(m for m in ("calendar", "numpy", "iso8601utils.parsers") if m in sys.modules))\n'
+        'iso8601utils.validators.date("2016-10-25")\n'
+        'print(sorted(k for k, v in vars(regex).items() if isinstance(v, regex.lazy) and "match" in vars(v)))\n'
+        'print(iso8601utils.parsers.date("2016-10-25"))\n')
+    assert output.split('\n')[:4] == ['[]', '[]', "['date_calendar']", '2016-10-25']
+
+
+def test_modules():
+    output = run('import sys, iso8601utils.parsers, iso8601utils.validators\n'
+        'print(sorted(m for m in sys.modules if m.startswith("iso8601utils")))\n'
+        'print(sorted(m for m in ("calendar", "copy", "numpy", "asyncio", "concurrent.futures") if m in sys.modules))\n')
+    assert output.split('\n')[:2] == [str(MODULES), '[]']
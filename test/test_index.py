@@ -0,0 +1,57 @@
+import pytest
+
+
+import random
+from datetime import datetime, timedelta
+from iso8601utils import interval, parsers
+from iso8601utils.index import IntervalIndex
+from iso8601utils.tz import utc
+
+
+def brute_force(intervals, start, end, inclusive):
+    return sorted([i for i in intervals if i.end > start and (i.start < end or (inclusive and i.start == end))],
+        key=lambda i: (i.start, i.end))
+
+
+def test_index():
+    index = IntervalIndex(['2007-11-13/15', '2007-11-14T12:00Z/P3D'])
+    index.insert(parsers.interval('2007-11-10/P1D'))
+    assert len(index) == 3
+    assert index.stab(datetime(2007, 11, 13, tzinfo=utc)) == [parsers.interval('2007-11-13/15')]
+    assert index.stab(datetime(2007, 11, 15, tzinfo=utc)) == [parsers.interval('2007-11-13/15'),
+        parsers.interval('2007-11-14T12:00Z/P3D')]
+    assert index.stab(datetime(2007, 11, 11, tzinfo=utc)) == []
+    assert index.overlap(datetime(2007, 11, 1, tzinfo=utc), datetime(2007, 11, 13, tzinfo=utc)) == [
+        parsers.interval('2007-11-10/P1D')]
+    assert parsers.interval('2007-11-10/P1D') in index
+
+    index.remove('2007-11-10/P1D')
+    assert len(index) == 2
+    assert parsers.interval('2007-11-10/P1D') not in index
+    assert index.overlap(datetime(2007, 11, 1, tzinfo=utc), datetime(2007, 11, 13, tzinfo=utc)) == []
+
+    with pytest.raises(KeyError):
+        index.remove('2007-11-10/P1D')
+
+
+def test_random():
+    random.seed(8601)
+    base = datetime(2016, 1, 1)
+    intervals = []
+    index = IntervalIndex()
+    for n in range(2000):
+        start = base + timedelta(hours=random.randint(0, 5000))
+        i = interval(start=start, end=start + timedelta(hours=random.randint(0, 200)))
+        intervals.append(i)
+        index.insert(i)
+    for i in random.sample(intervals, 700):
+        intervals.remove(i)
+        index.remove(i)
+    assert len(index) == len(intervals)
+    assert list(index) == sorted(intervals, key=lambda i: (i.start, i.end))
+
+    for n in range(200):
+        t = base + timedelta(hours=random.randint(-10, 5300))
+        assert index.stab(t) == brute_force(intervals, t, t, True)
+        end = t + timedelta(hours=random.randint(0, 100))
+        assert index.overlap(t, end) == brute_force(intervals, t, end, False)
@@ -0,0 +1,68 @@
+import pytest
+
+
+from datetime import date
+from iso8601utils import instrument, parsers
+from iso8601utils.helpers import regex
+
+
+@pytest.fixture
+def enabled():
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+
+
+def test_disabled():
+    (datetime, match) = (parsers.datetime, regex.date_week.match)
+    instrument.enable()
+    instrument.enable()
+    assert instrument.enabled()
+    assert parsers.datetime is not datetime
+    instrument.disable()
+    assert not instrument.enabled()
+    assert parsers.datetime is datetime
+    assert regex.date_week.match('2016-W43-1')
+    assert 'wrapper' not in getattr(regex.date_week.match, '__qualname__', '')
+
+
+def test_counts(enabled):
+    assert parsers.date('2016-W43-1') == date(2016, 10, 24)
+    assert parsers.try_date('2016-W63-1') is None
+    parsers.datetime('2016-08-01T23:10:59.111Z')
+    parsers.datetime('20160801T231059Z')
+    parsers.try_interval('P1Y/P1D')
+
+    snapshot = instrument.snapshot()
+    assert snapshot.regexes['date_week'] == instrument.Counts(hits=1, misses=1)
+    assert snapshot.regexes['date_week_bytes'] == instrument.Counts(hits=0, misses=0)
+    # The second is a basic datetime, the third the end of P1Y/P1D.
+    assert snapshot.branches['datetime_builder_fast'] == instrument.Counts(hits=1, misses=2)
+    assert snapshot.branches['datetime_builder'] == instrument.Counts(hits=2, misses=1)
+    assert snapshot.branches['interval_kwargs'] == instrument.Counts(hits=0, misses=1)
+    # parsers.datetime calls parsers.try_datetime, timed only as datetime.
+    assert sum(snapshot.timings['datetime'].values()) == 2
+    assert sum(snapshot.timings['try_datetime'].values()) == 0
+    assert sum(snapshot.timings['try_interval'].values()) == 1
+    assert all(bound & (bound - 1) == 0 for bound in snapshot.timings['date'])
+
+    instrument.reset()
+    assert instrument.snapshot().regexes['date_week'] == instrument.Counts(hits=0, misses=0)
+    assert sum(instrument.snapshot().timings['date'].values()) == 0
+
+
+def test_hooks(enabled):
+    calls = []
+    hook = lambda name, seconds, ok: calls.append((name, ok))
+    instrument.register(hook)
+    parsers.duration('P1D')
+    with pytest.raises(ValueError):
+        parsers.duration('P1X')
+    parsers.try_duration('P1D')
+    instrument.unregister(hook)
+    parsers.duration('P1D')
+    assert calls == [('duration', True), ('duration', False), ('try_duration', True)]
+
+    with pytest.raises(ValueError):
+        instrument.unregister(hook)
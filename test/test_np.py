@@ -0,0 +1,36 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from iso8601utils import np
+
+
+def test_datetimes():
+    (values, mask) = np.datetimes(['2007-08-09T12:30-02:00', 'invalid', '2016-08-01T23:10:59.111Z',
+        '1000-01-01T00:00Z', '1970-01-01T00:00:00.001+00:30'])
+    assert values.dtype == numpy.dtype('datetime64[ns]')
+    assert mask.tolist() == [True, False, True, False, True]
+    assert values[0] == numpy.datetime64('2007-08-09T14:30', 'ns')
+    assert numpy.isnat(values[1])
+    assert values[2] == numpy.datetime64('2016-08-01T23:10:59.111', 'ns')
+    assert numpy.isnat(values[3])
+    assert values[4] == numpy.datetime64('1969-12-31T23:30:00.001', 'ns')
+
+
+def test_durations():
+    (values, mask) = np.durations(numpy.array(['PT5M', 'P1D', 'P1M', 'asdf', 'P6W', 'PT.5005S']))
+    assert values.dtype == numpy.dtype('timedelta64[ns]')
+    assert mask.tolist() == [True, True, False, False, True, True]
+    assert values[0] == numpy.timedelta64(5, 'm')
+    assert values[1] == numpy.timedelta64(1, 'D')
+    assert numpy.isnat(values[2])
+    assert values[4] == numpy.timedelta64(6, 'W')
+    assert values[5] == numpy.timedelta64(500500, 'us')
+
+
+def test_missing():
+    (values, mask) = np.datetimes(numpy.array([None, float('nan'), '2007-08-09T12:30Z', 3], dtype=object))
+    assert mask.tolist() == [False, False, True, False]
+    assert numpy.isnat(values[0]) and numpy.isnat(values[1])
+    (values, mask) = np.durations(numpy.array([None, float('nan'), 'PT5M'], dtype=object))
+    assert mask.tolist() == [False, False, True]
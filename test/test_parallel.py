@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip('concurrent.futures')
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from iso8601utils import parallel, parsers, interval, duration
+from iso8601utils.tz import utc
+
+
+datetimes = ['2007-08-09T12:30Z', '20070809T1230-02', 'invalid', '2016-W43-1T00:00:00.5+05:30',
+    '1000-01-01T00:00:00+14:00', '2007-02-30T12:30Z']
+
+
+def test_datetimes():
+    expected = parsers.datetimes(datetimes, errors='none')
+    values = parallel.datetimes(datetimes, workers=2, chunk_size=2, errors='none')
+    assert values == expected
+    assert [value and value.tzinfo for value in values] == [value and value.tzinfo for value in expected]
+    assert parallel.datetimes(datetimes, chunk_size=4, errors='skip', epoch=True,
+        executor=ThreadPoolExecutor(2))[:2] == [1186662600000000, 1186669800000000]
+    assert parallel.datetimes([]) == []
+
+    with pytest.raises(ValueError) as e:
+        parallel.datetimes(datetimes, workers=1, chunk_size=1)
+    assert 'index 2' in str(e.value)
+    with pytest.raises(ValueError):
+        parallel.datetimes(datetimes, chunk_size=0)
+
+
+def test_durations():
+    durations = ['P6W', 'P1Y2M10DT2H30M', 'asdf', 'P0003-06-04T12:30:05', '-P1D', 'PT36H']
+    values = parallel.durations(durations, chunk_size=2, errors='none', executor=ThreadPoolExecutor(2))
+    assert values == parsers.durations(durations, errors='none')
+    assert [value.string() for value in values if value is not None] == ['P6W', 'P1Y2M10DT2H30M',
+        'P3Y6M4DT12H30M5S', 'P1DT12H']
+
+
+def test_intervals():
+    now = datetime(2016, 1, 1)
+    intervals = ['R5/2008-03-01T13:00:00Z/P1Y2M10DT2H30M', 'R/P1D', '2007-11-13/15', 'P6Y5M/P9D',
+        'P1M/2008-02-29T00:00+03:00']
+    values = parallel.intervals(intervals, now=now, chunk_size=2, errors='skip',
+        executor=ThreadPoolExecutor(2))
+    assert values == parsers.intervals(intervals, now=now, errors='skip')
+    assert values[1] == interval(end=now, duration=duration(days=1), repeats=float('inf'))
+    assert values[2].start == datetime(2007, 11, 13, tzinfo=utc)
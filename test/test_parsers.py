@@ -4,6 +4,7 @@ from monthdelta import MonthDelta as monthdelta
 from datetime import datetime as datetime_, timedelta, time as time_, date as date_
 from iso8601utils import parsers, interval, duration
 from iso8601utils.tz import timezone, utc
+from iso8601utils.helpers.builder import datetime_builder_fast
 
 
 def test_time():
@@ -110,6 +111,29 @@ def test_datetime():
     with pytest.raises(ValueError):
         parsers.datetime('invalid')
 
+def test_datetime_fast():
+    assert datetime_builder_fast('2007-04-05T14:30') == None
+    assert datetime_builder_fast('20070405T143000Z') == None
+    assert datetime_builder_fast('2007-04-05T14:30:00+05') == None
+    assert datetime_builder_fast('2007-04-05T14:30:00.Z') == None
+    assert datetime_builder_fast('2007-04-05T14:30:00+25:00') == None
+    assert datetime_builder_fast('2007-04-05T14:30:00') == datetime_(2007, 4, 5, 14, 30, tzinfo=utc)
+    assert datetime_builder_fast('2016-08-01T23:10:59.111Z') == datetime_(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)
+    assert datetime_builder_fast('2016-08-01T23:10:59,111Z') == datetime_(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)
+    assert datetime_builder_fast('2007-01-01T24:00:00Z') == datetime_(2007, 1, 2, tzinfo=utc)
+    assert datetime_builder_fast('2002-08-15T16:20:05.100+08:10') == datetime_(2002, 8, 15, 16, 20, 5, 100000,
+        tzinfo=timezone(hours=8, minutes=10))
+    assert datetime_builder_fast('2002-10-12T17:05:25.020-01:40') == datetime_(2002, 10, 12, 17, 5, 25, 20000,
+        tzinfo=-timezone(hours=1, minutes=40))
+
+    assert parsers.datetime('2007-04-05T14:30:00+05') == parsers.datetime('2007-04-05T14:30:00+05:00')
+    assert parsers.datetime('2016-08-01T23:10:59.111Z') == parsers.datetime('20160801T231059.111Z')
+
+    for invalid in ['2007-02-30T12:00:00Z', '2007-01-01T24:00:01Z', '2007-01-01T12:60:00Z',
+            '2007-01-01T12:00:00+00:00', '0000-01-01T12:00:00Z', '2007-01-01T12:00:00.5555555Z']:
+        with pytest.raises(ValueError):
+            parsers.datetime(invalid)
+
 def test_interval():
     now = datetime_(2016, 1, 1)
     with pytest.raises(ValueError):
@@ -219,3 +243,96 @@ def test_duration():
 
     with pytest.raises(ValueError):
         parsers.duration('')
+
+def test_batch():
+    assert parsers.datetimes(['2007-04-05T14:30', '2007-08-09T12:30-02:00']) == [
+        datetime_(2007, 4, 5, 14, 30, tzinfo=utc), datetime_(2007, 8, 9, 12, 30, tzinfo=-timezone(hours=2))]
+    assert parsers.datetimes(['2007-04-05T14:30', 'invalid'], errors='skip') == [
+        datetime_(2007, 4, 5, 14, 30, tzinfo=utc)]
+    assert parsers.datetimes(['invalid', '2007-04-05T14:30'], errors='none') == [
+        None, datetime_(2007, 4, 5, 14, 30, tzinfo=utc)]
+    assert list(parsers.dates(iter(['1981-095', '2016-W43-1']), lazy=True)) == [date_(1981, 4, 5), date_(2016, 10, 24)]
+    assert parsers.times(['12', '13:15+05:10']) == [time_(hour=12, tzinfo=utc),
+        time_(hour=13, minute=15, tzinfo=timezone(hours=5, minutes=10))]
+    assert parsers.durations(['P6W', 'asdf', 'P1D'], errors='none') == [duration(weeks=6), None, duration(days=1)]
+    now = datetime_(2016, 1, 1)
+    assert parsers.intervals(['P7Y', 'R1/P6Y5M'], now=now) == [interval(end=now, duration=duration(years=7)),
+        interval(end=now, repeats=1, duration=duration(years=6, months=5))]
+
+    with pytest.raises(ValueError) as e:
+        parsers.durations(['P6W', 'asdf'])
+    assert 'index 1' in str(e.value)
+
+    with pytest.raises(ValueError):
+        parsers.datetimes([], errors='ignore')
+
+def test_try():
+    assert parsers.try_time('13:15+05:10') == time_(hour=13, minute=15, tzinfo=timezone(hours=5, minutes=10))
+    assert parsers.try_time('24:00:00.0001') == None
+    assert parsers.try_date('2016-W43-1') == date_(2016, 10, 24)
+    assert parsers.try_date('2007-02-30') == None
+    assert parsers.try_datetime('2007-08-09T12:30Z') == datetime_(2007, 8, 9, 12, 30, tzinfo=utc)
+    assert parsers.try_datetime('2007-08-09T12:30+00:00') == None
+    assert parsers.try_datetime(None) == None
+    assert parsers.try_duration('P6W') == duration(weeks=6)
+    assert parsers.try_duration('23P7DT5H') == None
+    assert parsers.try_interval('2007-11-13/15') == interval(start=datetime_(2007, 11, 13, tzinfo=utc),
+        end=datetime_(2007, 11, 16, tzinfo=utc))
+    assert parsers.try_interval('R0/P1D', now=datetime_(2016, 1, 1)) == interval(end=datetime_(2016, 1, 1),
+        duration=duration(days=1))
+    for invalid in ['P6Y5M/P9D', 'R5/P1D/P2D', 'A4/1999-12-01T00:00:00/1999-12-31T16:00:00.000Z', 'a/b/c/d', 1]:
+        assert parsers.try_interval(invalid) == None
+
+    with pytest.raises(ValueError):
+        parsers.datetime(None)
+
+def test_parse():
+    now = datetime_(2016, 1, 1)
+    assert parsers.parse('13:15+05:10') == ('time', time_(hour=13, minute=15, tzinfo=timezone(hours=5, minutes=10)))
+    assert parsers.parse('12') == ('time', time_(hour=12, tzinfo=utc))
+    assert parsers.parse('12-05:10') == ('time', time_(hour=12, tzinfo=-timezone(hours=5, minutes=10)))
+    assert parsers.parse('1230') == ('date', date_(1230, 1, 1))
+    assert parsers.parse('2016-W43-1') == ('date', date_(2016, 10, 24))
+    assert parsers.parse('--04-03') == ('date', date_(1, 4, 3))
+    assert parsers.parse('2007-08-09T12:30Z') == ('datetime', datetime_(2007, 8, 9, 12, 30, tzinfo=utc))
+    assert parsers.parse('P6W') == ('duration', duration(weeks=6))
+    assert parsers.parse('P7Y/2016-01-01T00:00Z').kind == 'interval'
+    assert parsers.parse('R1/P6Y5M', now=now) == ('interval', interval(end=now, repeats=1,
+        duration=duration(years=6, months=5)))
+    assert parsers.parse('P6W').value == duration(weeks=6)
+
+    for invalid in ['asdf', 'P6Yasdf', '2007-02-30', '2007-08-09T25:00', 'P6Y5M/P9D', '', None]:
+        assert parsers.try_parse(invalid) == None
+
+    with pytest.raises(ValueError):
+        parsers.parse('asdf')
+
+    (results, counts) = parsers.parse_many(['P6W', '2007-08-09T12:30Z', 'asdf', 'P1D', '13:15'])
+    assert [result.kind if result else None for result in results] == ['duration', 'datetime', None,
+        'duration', 'time']
+    assert counts == {'duration': 2, 'datetime': 1, 'time': 1, None: 1}
+
+
+def test_bytes():
+    now = datetime_(2016, 1, 1)
+    buffer = bytearray(b'id=7 at 2007-08-09T12:30:00.500+05:30 for P1DT2H')
+    view = memoryview(buffer)
+    assert parsers.datetime(view[8:37]) == datetime_(2007, 8, 9, 12, 30, 0, 500000,
+        tzinfo=timezone(hours=5, minutes=30))
+    assert parsers.duration(view[42:]) == duration(days=1, hours=2)
+    assert parsers.datetime(b'20070809T1230-02') == parsers.datetime('20070809T1230-02')
+    assert parsers.datetime(bytearray(b'2007-08-09T24:00Z')) == datetime_(2007, 8, 10, tzinfo=utc)
+    assert parsers.date(b'2016-W43-1') == date_(2016, 10, 24)
+    assert parsers.time(b'13:15+05:10') == time_(hour=13, minute=15, tzinfo=timezone(hours=5, minutes=10))
+    assert parsers.interval(b'R5/2008-03-01T13:00:00Z/P1Y2M10DT2H30M') == parsers.interval(
+        'R5/2008-03-01T13:00:00Z/P1Y2M10DT2H30M')
+    assert parsers.interval(b'2007-11-13/15') == parsers.interval('2007-11-13/15')
+    assert parsers.interval(b'R/P1D', now=now, designator=b'/') == interval(end=now, repeats=float('inf'),
+        duration=duration(days=1))
+    assert parsers.parse(memoryview(b'P6W')) == ('duration', duration(weeks=6))
+    assert parsers.parse(b'2007-08-09T12:30Z').kind == 'datetime'
+    assert parsers.try_datetime(b'2007-08-09T12:30+00:00') == None
+    assert parsers.try_datetime(b'2007-02-30T12:30Z') == None
+    assert parsers.try_date(b'2007-\xff') == None
+    assert parsers.datetimes([b'2007-08-09T12:30Z', '2007-08-09T12:30Z'], errors='none') == [
+        datetime_(2007, 8, 9, 12, 30, tzinfo=utc)] * 2
@@ -4,7 +4,7 @@ import pytest
 from datetime import datetime, timedelta, date
 from iso8601utils.tz import utc
 from iso8601utils.helpers.builder import (datetime_builder, datetime_builder_partial,
-    date_builder_partial, interval_datetimes_builder)
+    date_builder_partial, date_builder_strict, date_shape, duration_shape, interval_datetimes_builder)
 from iso8601utils.validators import _datetime_partial, _datetime_strict
 
 
@@ -25,6 +25,31 @@ def test_partial():
     e = datetime_builder_partial('15', timedelta(1), s)
     assert e == datetime(2007, 11, 16, 0, 0, tzinfo=utc)
 
+def test_shape():
+    assert date_shape('2008') == 'calendar'
+    assert date_shape('2008-09') == 'calendar'
+    assert date_shape('200809') == 'calendar'
+    assert date_shape('2008-09-27') == 'calendar'
+    assert date_shape('20080927') == 'calendar'
+    assert date_shape('--09-27') == 'no_year'
+    assert date_shape('2008-W39-6') == 'week'
+    assert date_shape('2008w396') == 'week'
+    assert date_shape('2008-271') == 'ordinal'
+    assert date_shape('2008271') == 'ordinal'
+    assert date_shape('1981-0405') == None
+    assert duration_shape('P3Y6M4DT12H30M5S') == 'standard'
+    assert duration_shape('P0003-06-04T12:30:05') == 'datetime'
+    assert duration_shape('P6W') == 'week'
+    assert duration_shape('') == 'standard'
+
+def test_strict():
+    assert date_builder_strict('2008-09-27') == date(2008, 9, 27)
+    assert date_builder_strict('2008-W39-6') == date(2008, 9, 27)
+    assert date_builder_strict('2008-271') == date(2008, 9, 27)
+
+    assert date_builder_strict('2008-09') == None
+    assert date_builder_strict('2007-02-30') == None
+
 def test_builder():
     (s, e) = interval_datetimes_builder('2007-11-13', '15')
     assert s == datetime(2007, 11, 13, 0, 0, tzinfo=utc)
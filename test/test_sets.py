@@ -0,0 +1,67 @@
+import pytest
+
+
+import random
+from datetime import datetime, timedelta
+from iso8601utils import duration, interval, parsers
+from iso8601utils.sets import IntervalSet
+from iso8601utils.tz import utc
+
+
+base = datetime(2020, 1, 1, tzinfo=utc)
+
+
+def minutes(values):
+    """The set of minutes covered by a list of (start, end) minute pairs."""
+    return set(m for (start, end) in values for m in range(start, end))
+
+
+def to_set(values):
+    return IntervalSet([interval(start=base + timedelta(minutes=start), duration=duration(minutes=end - start))
+        for (start, end) in values])
+
+
+def covered(value):
+    return set(m for i in value for m in range(int((i.start - base).total_seconds() // 60),
+        int((i.end - base).total_seconds() // 60)))
+
+
+def test_set():
+    outages = IntervalSet(['2020-01-01T00:00Z/PT1H', '2020-01-01T00:30Z/PT1H', '2020-01-01T01:30Z/PT30M',
+        'R3/2020-01-02T00:00Z/PT1H'])
+    assert [i.string() for i in outages] == ['2020-01-01T00:00:00.000000Z/2020-01-01T02:00:00.000000Z',
+        '2020-01-02T00:00:00.000000Z/2020-01-02T03:00:00.000000Z']
+    assert outages.total() == duration(hours=5)
+    assert datetime(2020, 1, 1, 1, 59, tzinfo=utc) in outages
+    assert datetime(2020, 1, 1, 2, tzinfo=utc) not in outages
+    assert datetime(2020, 1, 2, tzinfo=utc) in outages
+
+    maintenance = IntervalSet(['2020-01-01T01:00Z/PT2H'])
+    assert (outages - maintenance).total() == duration(hours=4)
+    assert (outages & maintenance).total() == duration(hours=1)
+    assert (outages | maintenance).total() == duration(hours=6)
+    assert outages.complement('2020-01-01T00:00Z/P2D').total() == duration(days=1, hours=19)
+    assert IntervalSet() == IntervalSet(['2020-01-01T00:00Z/PT0S'])
+    assert not IntervalSet()
+    assert hash(outages & maintenance) == hash(IntervalSet(['2020-01-01T01:00Z/PT1H']))
+    assert IntervalSet.from_spans([(base, base + timedelta(hours=1))]) == IntervalSet(['2020-01-01T00:00Z/PT1H'])
+
+    with pytest.raises(ValueError):
+        IntervalSet(['R/2020-01-01T00:00Z/PT1H'])
+
+
+def test_random():
+    r = random.Random(5)
+    for _ in range(200):
+        a = [(s, s + r.randint(0, 30)) for s in (r.randint(0, 200) for _ in range(r.randint(0, 8)))]
+        b = [(s, s + r.randint(0, 30)) for s in (r.randint(0, 200) for _ in range(r.randint(0, 8)))]
+        (x, y) = (to_set(a), to_set(b))
+        assert covered(x) == minutes(a)
+        assert covered(x | y) == minutes(a) | minutes(b)
+        assert covered(x & y) == minutes(a) & minutes(b)
+        assert covered(x - y) == minutes(a) - minutes(b)
+        assert covered(x.complement(interval(start=base, duration=duration(minutes=250)))) == (
+            set(range(250)) - minutes(a))
+        assert [i.start < i.end for i in x - y] == [True] * len(x - y)
+        for m in range(0, 240, 7):
+            assert (base + timedelta(minutes=m) in x) == (m in minutes(a))
@@ -0,0 +1,36 @@
+import pytest
+
+
+from datetime import datetime
+from iso8601utils import stream, parsers
+from iso8601utils.tz import utc
+
+
+def write(tmpdir, content):
+    path = tmpdir.join('data')
+    path.write_binary(content)
+    return str(path)
+
+
+def test_columns(tmpdir):
+    path = write(tmpdir, b'id,time\r\n1,2007-08-09T12:30-02:00\r\n2,invalid\r\n3\r\n4,2016-08-01T23:10:59.111Z,x\r\n')
+    assert list(stream.scan(path, column=1, skip=1)) == [parsers.datetime('2007-08-09T12:30-02:00'), None, None,
+        datetime(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)]
+    assert list(stream.scan(path, column=1, skip=1, errors='skip', epoch=True)) == [1186669800000000,
+        1470093059111000]
+    assert list(stream.chunks(path, column=1, skip=1, errors='skip', chunk_size=1)) == [
+        [parsers.datetime('2007-08-09T12:30-02:00')], [datetime(2016, 8, 1, 23, 10, 59, 111000, tzinfo=utc)]]
+
+    with pytest.raises(ValueError) as e:
+        list(stream.scan(path, column=1, skip=1, errors='raise'))
+    assert 'line 3' in str(e.value)
+
+
+def test_offset(tmpdir):
+    path = write(tmpdir, b'[2007-08-09T12:30Z] INFO start\n[2007-08-09T12:31Z] INFO stop')
+    assert list(stream.scan(path, offset=1, delimiter=b']')) == [datetime(2007, 8, 9, 12, 30, tzinfo=utc),
+        datetime(2007, 8, 9, 12, 31, tzinfo=utc)]
+
+
+def test_empty(tmpdir):
+    assert list(stream.scan(write(tmpdir, b''))) == []
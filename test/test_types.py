@@ -0,0 +1,141 @@
+import pytest
+
+
+import pickle
+from itertools import islice
+from copy import copy, deepcopy
+from datetime import datetime, timedelta
+from iso8601utils import duration, interval, parsers
+from iso8601utils.tz import utc, fixed
+
+
+def test_duration():
+    d = duration(years=1, months=5, days=3, hours=12)
+    assert not hasattr(d, '__dict__')
+
+    with pytest.raises(AttributeError):
+        d.timedelta = timedelta(0)
+
+    with pytest.raises(AttributeError):
+        del d.monthdelta
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(d, protocol)) == d
+    w = duration(weeks=6)
+    assert pickle.loads(pickle.dumps(w)).string() == 'P6W'
+    assert copy(d) == d
+    assert deepcopy(d) == d
+    assert d + duration(days=2, hours=5) == duration(years=1, months=5, days=5, hours=17)
+
+    # Pickles of earlier versions hold (timedelta, monthdelta, format).
+    old = duration.__new__(duration)
+    old.__setstate__((d.timedelta, d.monthdelta, 'DURATION'))
+    assert old == d
+
+
+def test_arithmetic():
+    d = duration(months=2, days=1, hours=12, seconds=0.5)
+    assert (d.timedelta, d.monthdelta.months) == (timedelta(days=1, hours=12, seconds=0.5), 2)
+    assert (-d).timedelta == -timedelta(days=1, hours=12, seconds=0.5)
+    assert (-d).monthdelta.months == -2
+    assert abs(-d) == d
+    assert +d == d
+    assert d - d == duration()
+    assert d * 3 == 3 * d == d + d + d
+    assert (d * 3).timedelta == timedelta(days=4, hours=12, seconds=1.5)
+    assert d * 3 // 3 == d
+    assert (d // 2).timedelta == timedelta(hours=18, seconds=0.25)
+    assert hash(d + d) == hash(d * 2)
+    assert sum([d] * 1000, duration()) == d * 1000
+    assert (d * 3).string() == 'P6M4DT12H1.5S'
+
+    with pytest.raises(OverflowError):
+        duration(days=999999999) + duration(days=1)
+
+
+def test_interval():
+    i = interval(start=datetime(2007, 11, 13, tzinfo=fixed(5, 30)), duration=duration(days=2), repeats=3)
+    assert not hasattr(i, '__dict__')
+
+    with pytest.raises(AttributeError):
+        i.repeats = 4
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(i, protocol)) == i
+    assert copy(i) == i
+    assert deepcopy(i) == i
+    assert i.end == datetime(2007, 11, 15, tzinfo=fixed(5, 30))
+
+
+def test_ordering():
+    a = duration(years=1, months=5, days=3, hours=12)
+    b = duration(days=2, hours=5)
+    assert a > b
+    assert b < a
+    assert a >= a
+    assert a <= a
+    assert duration(months=1) < duration(days=31)
+    assert duration(months=1) > duration(days=30)
+    assert duration(months=12) == duration(years=1)
+    assert duration(months=1).sort_key != duration(seconds=2629746).sort_key
+    assert duration(months=1) > duration(seconds=2629746)
+
+    durations = [duration(days=40), duration(months=1), duration(hours=1), -duration(days=1), duration(weeks=1)]
+    assert sorted(durations) == [-duration(days=1), duration(hours=1), duration(weeks=1),
+        duration(months=1), duration(days=40)]
+    assert sorted(durations, key=lambda d: d.sort_key) == sorted(durations)
+    assert min(durations) == -duration(days=1)
+    assert max(durations) == duration(days=40)
+
+
+def test_occurrences():
+    i = interval(start=datetime(2020, 1, 1, tzinfo=utc), duration=duration(minutes=15), repeats=3)
+    assert list(i.occurrences()) == [(datetime(2020, 1, 1, 0, 0, tzinfo=utc), datetime(2020, 1, 1, 0, 15, tzinfo=utc)),
+        (datetime(2020, 1, 1, 0, 15, tzinfo=utc), datetime(2020, 1, 1, 0, 30, tzinfo=utc)),
+        (datetime(2020, 1, 1, 0, 30, tzinfo=utc), datetime(2020, 1, 1, 0, 45, tzinfo=utc))]
+    assert i.nth(2) == (datetime(2020, 1, 1, 0, 30, tzinfo=utc), datetime(2020, 1, 1, 0, 45, tzinfo=utc))
+
+    with pytest.raises(IndexError):
+        i.nth(3)
+
+    with pytest.raises(IndexError):
+        i.nth(-1)
+
+    once = interval(start=datetime(2020, 1, 1), end=datetime(2020, 1, 2))
+    assert list(once.occurrences()) == [(datetime(2020, 1, 1), datetime(2020, 1, 2))]
+
+    forever = interval(start=datetime(2020, 1, 31), duration=duration(months=1, days=1), repeats=interval.INFINITE)
+    occurrences = forever.occurrences()
+    assert next(occurrences) == (datetime(2020, 1, 31), datetime(2020, 3, 1))
+    assert next(occurrences) == (datetime(2020, 3, 1), datetime(2020, 4, 2))
+    assert next(occurrences) == (datetime(2020, 4, 2), datetime(2020, 5, 3))
+    assert forever.nth(1000)[0] == datetime(2020, 1, 31) + timedelta(days=1000) + duration(months=1000).monthdelta
+
+    last = interval(start=datetime(9999, 12, 30), duration=duration(days=1), repeats=interval.INFINITE)
+    assert list(last.occurrences()) == [(datetime(9999, 12, 30), datetime(9999, 12, 31))]
+
+
+def test_locate():
+    i = parsers.interval('R/2020-01-01T00:00Z/PT15M')
+    assert i.locate(datetime(2020, 1, 1, 0, 20, tzinfo=utc)) == (1, datetime(2020, 1, 1, 0, 15, tzinfo=utc),
+        datetime(2020, 1, 1, 0, 30, tzinfo=utc))
+    assert i.locate(datetime(2020, 1, 1, 5, 30, 1, tzinfo=fixed(5, 30))) == i.locate(datetime(2020, 1, 1, tzinfo=utc))
+    assert i.locate(datetime(2019, 12, 31, 23, 59, tzinfo=utc)) is None
+    assert i.locate(datetime(2021, 1, 1, tzinfo=utc))[0] == 366 * 96
+
+    finite = interval(start=datetime(2020, 1, 1), duration=duration(minutes=15), repeats=3)
+    assert [value and value[0] for value in finite.locate_many(
+        [datetime(2020, 1, 1, 0, 44, 59), datetime(2020, 1, 1, 0, 45), datetime(2020, 1, 1)])] == [2, None, 0]
+    assert interval(start=datetime(2020, 1, 1), end=datetime(2020, 1, 2)).locate(datetime(2020, 1, 1, 12))[0] == 0
+
+    # Months vary in length, so check against stepping through every occurrence.
+    monthly = interval(start=datetime(2020, 1, 31), duration=duration(months=1, days=1), repeats=interval.INFINITE)
+    occurrences = list(islice(monthly.occurrences(), 200))
+    ts = [datetime(2020, 1, 31) + timedelta(hours=h) for h in range(0, 140000, 37)]
+    expected = [next(((k, s, e) for (k, (s, e)) in enumerate(occurrences) if s <= t < e), None) for t in ts]
+    assert monthly.locate_many(ts) == expected
+    assert monthly.locate(datetime(9999, 12, 31)) is None
+
+    assert interval(start=datetime(2020, 1, 1), duration=duration()).locate(datetime(2020, 1, 1)) is None
+    with pytest.raises(ValueError):
+        interval(start=datetime(2020, 1, 1), duration=-duration(days=1)).locate(datetime(2020, 1, 1))
@@ -2,7 +2,8 @@ import pytest
 
 
 from datetime import timedelta
-from iso8601utils.tz import timezone
+from iso8601utils import parsers, validators
+from iso8601utils.tz import timezone, fixed
 
 
 def test_tz():
@@ -37,3 +38,31 @@ def test_tz():
     assert tz.utcoffset(None) == -timedelta(hours=4, minutes=30)
     assert tz.__repr__() == 'test'
     assert str(tz) == 'test'
+
+
+def test_fixed():
+    assert fixed(5, 30) is fixed(5, 30)
+    assert fixed(-5, -30) is fixed(-5, -30)
+    assert fixed(-5, -30) is not fixed(5, 30)
+    assert fixed(-5, -30).utcoffset(None) == -timedelta(hours=5, minutes=30)
+    assert str(fixed(-5, -30)) == '-05:30'
+    assert str(fixed(23, 59)) == '+23:59'
+
+    with pytest.raises(ValueError):
+        fixed(24)
+
+    with pytest.raises(ValueError):
+        fixed(-24)
+
+    with pytest.raises(ValueError):
+        fixed(5, -30)
+
+    with pytest.raises(AttributeError):
+        fixed(5, 30).name = 'test'
+
+    assert parsers.time('12+05:10').tzinfo is parsers.datetime('2007-08-09T12:30+05:10').tzinfo
+    for string in ('2007-08-09T12:00:00+24:00', '2007-08-09T12:00+24:00', '2007-08-09T12:00:00-2400'):
+        assert parsers.try_datetime(string) is None
+        assert not validators.datetime(string)
+    assert parsers.try_time('12:00+24:00') is None
+    assert parsers.time('12-05:10').tzinfo is parsers.time('1200-0510').tzinfo
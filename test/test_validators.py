@@ -66,6 +66,11 @@ def test_time():
     assert time('12:30:40.05+0:15') == False
     assert time('1230401.05+10:15') == False
     assert time('24:00:00.0001') == False
+    assert time('24:00:01') == False
+    assert time('24:00:00.000') == True
+    assert time('12+00:00') == False
+    assert time('12-00') == False
+    assert time('12:30:40.1234') == False
     assert time('12') == True
     assert time('24:00:00') == True
     assert time('00:00:00') == True
@@ -110,3 +115,25 @@ def test_datetime():
     assert datetime('007-04-15T12:30') == False
     assert datetime('2007-08-09T12:30+0') == False
     assert datetime('2007-08-09T12:30-02:aa') == False
+
+
+def test_bytes():
+    assert datetime(b'2007-08-09T12:30-02:00') == True
+    assert datetime(memoryview(b'2007-08-09T12:30+00:00')) == False
+    assert date(bytearray(b'2016-W43-1')) == True
+    assert date(b'2007-\xff') == False
+    assert time(b'24:00:00') == True
+    assert time(b'24:00:01') == False
+    assert duration(memoryview(b'P6W')) == True
+    assert interval(b'R5/2008-03-01T13:00:00Z/P1Y2M10DT2H30M') == True
+    assert interval(b'2007-11-13/15') == True
+    assert interval(b'P6Y5M/P9D') == False
+
+
+def test_not_strings():
+    for value in (None, 1, 1.5, [], {}):
+        assert time(value) == False
+        assert date(value) == False
+        assert datetime(value) == False
+        assert duration(value) == False
+        assert interval(value) == False